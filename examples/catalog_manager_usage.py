@@ -4,10 +4,10 @@ from pathlib import Path
 import typing
 from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
-import json
 from hashlib import md5
 
 import pystac 
+import rasterio
 from pystac import Catalog, Collection, Item, Asset, MediaType, Extent, SpatialExtent, TemporalExtent
 from pystac.extensions.projection import ProjectionExtension
 
@@ -15,9 +15,11 @@ from stac_manager.catalog_manager import setup_catalog_manager, CatalogManager
 from stac_manager.catalog_loader import get_catalog_loader, CatalogDataLoader, CatalogLoaderFactory
 
 from stac_manager.collection_manager import CollectionManager
+from stac_manager.data_models import IngestJob
 from stac_manager.item_manager import AbstractItem, ItemFactoryManager, RasterItem, VRTItem
 from stac_manager.catalog_extents import GenericExtent
 from stac_manager.stac_metadata import Metadata, MetaDataExtractorFactory
+from stac_manager.constants import GDAL_CONFIG_OPTIONS
 
 import config.settings as settings
 
@@ -28,6 +30,11 @@ COLLECTION_ID_1 = "tif-1"
 COLLECTION_ID_2 = "tif-2"
 COLLECTION_ID_3 = "vrt-1"
 
+# collections of the batch ingest in example 2
+BATCH_COLLECTION_ID_1 = "batch-tif-1"
+BATCH_COLLECTION_ID_2 = "batch-tif-2"
+BATCH_COLLECTION_ID_3 = "batch-vrt-1"
+
 # --------------------------------------------------------------------------------------
 # ----- Get data loader and meta data extractor factory -----
 # --------------------------------------------------------------------------------------
@@ -60,7 +67,6 @@ catalog_manager.describe()
 # catalog_manager.set_catalog_description(settings.ROOT_CATALOG_DESCRIPTION)
 # vars(catalog_manager.get_catalog())
 
-catalog_manager.describe()
 catalog_manager.get_supported_data_types()
 
 # --------------------------------------------------------------------------------------
@@ -70,62 +76,92 @@ catalog_manager.get_supported_data_types()
 # Summary:
 # - ADD 3 collections with 1 item each
 
-# # add a new collection 1
-catalog_manager.add_child_collection(collection_id=COLLECTION_ID_1, 
-                                     title=f"{COLLECTION_ID_1}-title", 
-                                     description=f"{COLLECTION_ID_1}-desc"
-                                     )
-
-catalog_manager.describe() 
-
-# Add TIF 1 item to collection 1
-catalog_manager.add_item_to_collection(
-    collection_id=COLLECTION_ID_1,
-    data_path=settings.TIF_URI_1,
-    properties={"priority": 2}
-)
-catalog_manager.save_catalog(catalog_type=pystac.CatalogType.SELF_CONTAINED)
-for children in catalog_manager.get_children():
-    print(children)
-    for item in children.get_all_items():
-        print(f" > {item}")
-        print(json.dumps(item.to_dict(), indent=4)) 
-
-catalog_manager.describe()
-
-# add new collection 2
-catalog_manager.add_child_collection(collection_id=COLLECTION_ID_2, 
-                                     title=f"{COLLECTION_ID_2}-title", 
-                                     description=f"{COLLECTION_ID_2}-desc"
-                                     )
-
-catalog_manager.describe()
-
-# Add TIF 2 item to collection 2
-catalog_manager.add_item_to_collection(
-    collection_id=COLLECTION_ID_2,
-    data_path=settings.TIF_URI_2,
-    properties={"priority": 1}
-)
+# One GDAL environment for the whole ingest, so GDAL setup, the VSI cache and 
+# the HTTP connections are reused across every file opened below
+with rasterio.Env(
+    **GDAL_CONFIG_OPTIONS, 
+    VSI_CACHE_SIZE=25_000_000
+    ):
+
+    # # add a new collection 1
+    catalog_manager.add_child_collection(collection_id=COLLECTION_ID_1, 
+                                         title=f"{COLLECTION_ID_1}-title", 
+                                         description=f"{COLLECTION_ID_1}-desc"
+                                         )
+
+    catalog_manager.describe() 
+
+    # Add TIF 1 item to collection 1
+    catalog_manager.add_item_to_collection(
+        collection_id=COLLECTION_ID_1,
+        data_path=settings.TIF_URI_1,
+        properties={"priority": 2}
+    )
+    catalog_manager.save_catalog(catalog_type=pystac.CatalogType.SELF_CONTAINED)
+    # pystac's StacIO serializes with orjson when it is installed (pip install stac_manager[fast])
+    stac_io = pystac.StacIO.default()
+    for children in catalog_manager.get_children():
+        print(children)
+        for item in children.get_all_items():
+            print(f" > {item}")
+            print(stac_io.json_dumps(item.to_dict())) 
+
+    catalog_manager.describe()
+
+    # add new collection 2
+    catalog_manager.add_child_collection(collection_id=COLLECTION_ID_2, 
+                                         title=f"{COLLECTION_ID_2}-title", 
+                                         description=f"{COLLECTION_ID_2}-desc"
+                                         )
+
+    catalog_manager.describe()
+
+    # Add TIF 2 item to collection 2
+    catalog_manager.add_item_to_collection(
+        collection_id=COLLECTION_ID_2,
+        data_path=settings.TIF_URI_2,
+        properties={"priority": 1}
+    )
+
+
+    # add new collection 3
+    catalog_manager.add_child_collection(collection_id=COLLECTION_ID_3, 
+                                         title=f"{COLLECTION_ID_3}-title", 
+                                         description=f"{COLLECTION_ID_3}-desc"
+                                         )
+
+    catalog_manager.describe()
+
+    # Add TIF 2 item to collection 2
+    catalog_manager.add_item_to_collection(
+        collection_id=COLLECTION_ID_3,
+        data_path=settings.VRT_URI,
+        properties={"priority": 0}
+    )
+
+    catalog_manager.describe()
+
+# the catalog was saved after the first item, so only collections 2 and 3 and their items are written
+catalog_manager.save_changes(catalog_type=pystac.CatalogType.SELF_CONTAINED)
 
+# --------------------------------------------------------------------------------------
+# ----- Example usage 2 (batch ingest) -----
+# --------------------------------------------------------------------------------------
 
-# add new collection 3
-catalog_manager.add_child_collection(collection_id=COLLECTION_ID_3, 
-                                     title=f"{COLLECTION_ID_3}-title", 
-                                     description=f"{COLLECTION_ID_3}-desc"
-                                     )
+# Summary:
+# - ADD 3 collections with 1 item each in one batch
+# - Items for every collection are created on worker threads, then added to their 
+#   collections on the main thread (pystac objects are not thread safe)
 
-catalog_manager.describe()
+jobs = [
+    IngestJob(BATCH_COLLECTION_ID_1, f"{BATCH_COLLECTION_ID_1}-title", f"{BATCH_COLLECTION_ID_1}-desc", [settings.TIF_URI_1], {"priority": 2}),
+    IngestJob(BATCH_COLLECTION_ID_2, f"{BATCH_COLLECTION_ID_2}-title", f"{BATCH_COLLECTION_ID_2}-desc", [settings.TIF_URI_2], {"priority": 1}),
+    IngestJob(BATCH_COLLECTION_ID_3, f"{BATCH_COLLECTION_ID_3}-title", f"{BATCH_COLLECTION_ID_3}-desc", [settings.VRT_URI], {"priority": 0}),
+]
 
-# Add TIF 2 item to collection 2
-catalog_manager.add_item_to_collection(
-    collection_id=COLLECTION_ID_3,
-    data_path=settings.VRT_URI,
-    properties={"priority": 0}
-)
+catalog_manager.ingest(jobs, max_workers=8)
 
 catalog_manager.describe()
 
-# TODO: Save
-
-catalog_manager.save_catalog(catalog_type=pystac.CatalogType.SELF_CONTAINED)
\ No newline at end of file
+# only the new batch collections and their items are written
+catalog_manager.save_changes(catalog_type=pystac.CatalogType.SELF_CONTAINED)
@@ -17,10 +17,9 @@ from stac_manager.catalog_manager import setup_catalog_manager, CatalogManager
 from stac_manager.catalog_loader import get_catalog_loader, CatalogDataLoader, CatalogLoaderFactory
 from stac_manager.collection_manager import CollectionManager
 from stac_manager.stac_metadata import Metadata, MetaDataExtractorFactory
-from stac_manager.data_models import STACCollectionSource, STACItemSource
+from stac_manager.data_models import STACCollectionSource, STACItemSource, IngestJob
 
 import config.settings as settings
-import json  
 
 # Example data record that can be used for testing
 data = {
@@ -66,18 +65,25 @@ HTML_URLS = [
 ]
 
 
+# Data sources by file name and the Hawaii tiles, both looked up once
+DATA_SOURCES_BY_NAME = {basename(url): url for url in DATA_SOURCES}
+HAWAII_URLS = [
+    url for url, lowered in ((url, url.lower()) for url in DATA_SOURCES) 
+    if "ncei" in lowered and "hawaii" in lowered
+    ]
+
 # List of STAC Items that will be added to the collections specified above
 items = [
     STACItemSource(
         collection_id = "conus",
-        id = basename([i for i in DATA_SOURCES if "USGS_Seamless_DEM_1.vrt" in i][0]),
-        data_path = [i for i in DATA_SOURCES if "USGS_Seamless_DEM_1.vrt" in i][0],
+        id = "USGS_Seamless_DEM_1.vrt",
+        data_path = DATA_SOURCES_BY_NAME["USGS_Seamless_DEM_1.vrt"],
         properties = {"priority": 1}
     ),
     STACItemSource(
         collection_id = "conus",
-        id = basename([i for i in DATA_SOURCES if "USGS_Seamless_DEM_13.vrt" in i][0]),
-        data_path = [i for i in DATA_SOURCES if "USGS_Seamless_DEM_13.vrt" in i][0],
+        id = "USGS_Seamless_DEM_13.vrt",
+        data_path = DATA_SOURCES_BY_NAME["USGS_Seamless_DEM_13.vrt"],
         properties = {"priority": 1}
     ),
     *(
@@ -86,7 +92,7 @@ items = [
             id = basename(i),
             data_path= i,
             properties={"priority" : 2}
-        ) for i in DATA_SOURCES if "ncei" in i.lower() and "hawaii" in i.lower()
+        ) for i in HAWAII_URLS
     )
 ]
 
@@ -133,17 +139,30 @@ for collection in collections:
 # ----- Go through list of items and add the item to respective collection -----
 # --------------------------------------------------------------------------------------
 
+# one ingest job per collection and set of item properties, so every item keeps its own properties and ID.
+# Collections without items were already added above
+collections_by_id = {collection.id: collection for collection in collections}
+jobs: Dict[Tuple, IngestJob] = {}
+
 for item in items:
     print(f"Item:\n > {item}")
 
-    # add items to collections 
-    catalog_manager.add_item_to_collection(
-        collection_id=item.collection_id,
-        data_path=item.data_path,
-        properties = item.properties
+    key = (item.collection_id, frozenset(item.properties.items()))
+    if key not in jobs:
+        collection = collections_by_id[item.collection_id]
+        jobs[key] = IngestJob(
+            collection_id=collection.id,
+            title=collection.title,
+            description=collection.description,
+            data_paths=[],
+            properties=item.properties
         )
+    jobs[key].data_paths.append(item.data_path)
+    jobs[key].item_ids.append(item.id)
 
-    print()
+# the (remote) files are read concurrently, reading metadata is mostly waiting on the network.
+# Items are added to their collections on this thread (pystac objects are not thread safe)
+catalog_manager.ingest(list(jobs.values()), max_workers=16)
 
 catalog_manager.describe()
 
@@ -151,5 +170,3 @@ catalog_manager.describe()
 # ----- Save catalog -----
 # --------------------------------------------------------------------------------------
 catalog_manager.save_catalog(catalog_type=pystac.CatalogType.SELF_CONTAINED)
-
-catalog_manager.describe()
\ No newline at end of file
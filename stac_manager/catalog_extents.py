@@ -1,14 +1,22 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import functools
 from typing import Dict, List, Optional, Union
+import numpy as np
 import pystac
 from pystac import Catalog, Collection, Item, Asset, MediaType, Extent, SpatialExtent, TemporalExtent
 
+from stac_manager.stac_metadata import MetaDataExtractorFactory
+
 class GenericExtent:
 
+    __slots__ = ('bbox', 'temporal_interval', '_extent')
+
     def __init__(self, bbox = None, temporal_interval = None):
         self.bbox = bbox
         self.temporal_interval = temporal_interval
+        self._extent = None
     
     def get_extent(self) -> Extent:
         """
@@ -16,10 +24,13 @@ class GenericExtent:
         
         If bbox is None, uses global extent [-180, -90, 180, 90].
         If temporal_interval is None, uses [current_time, current_time].
+        The Extent is built once and the same object is returned on subsequent calls.
         
         Returns:
             pystac.Extent object containing spatial and temporal extent information
         """
+        if self._extent is not None:
+            return self._extent
 
         # Default to global extent if no bbox is available
         if self.bbox is None:
@@ -27,11 +38,10 @@ class GenericExtent:
         
         # Default to current time for both start and end if no temporal interval
         if self.temporal_interval is None:
-            current_time = datetime.now(timezone.utc)
-            self.temporal_interval = [current_time, current_time]
+            self.temporal_interval = get_current_temporal_interval()
             
         # Create and return a proper PySTAC Extent object
-        return Extent(
+        self._extent = Extent(
             spatial=SpatialExtent(
                 bboxes=[self.bbox]
             ),
@@ -42,25 +52,73 @@ class GenericExtent:
                 ]]
             )
         )
+        return self._extent
+
+class ExtentBuilder:
+    """
+    Accumulate bounding boxes from many sources into a single bbox covering all of them, 
+    and build a PySTAC Extent from the result.
+    """
+
+    def __init__(self):
+        self.bbox = None
+        self.temporal_interval = None
+
+    def update_bbox(self, bbox: List[float]) -> None:
+        """
+        Expand the bbox to cover a single [xmin, ymin, xmax, ymax] bbox.
+        """
+        self.update_bboxes(np.asarray([bbox], dtype=np.float64))
+
+    def update_bboxes(self, bboxes: np.ndarray) -> None:
+        """
+        Expand the bbox to cover all rows of an (N, 4) array of [xmin, ymin, xmax, ymax] bboxes.
+        The union is computed with a vectorized min/max over the columns.
+        """
+        bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        if len(bboxes) == 0:
+            return
+
+        if self.bbox is not None:
+            bboxes = np.vstack([bboxes, [self.bbox]])
+
+        self.bbox = np.concatenate([bboxes[:, :2].min(axis=0), bboxes[:, 2:].max(axis=0)]).tolist()
+
+    def build(self) -> Extent:
+        """
+        Build a PySTAC Extent, see GenericExtent.get_extent() for the defaults used 
+        when no bbox or temporal interval was set.
+        """
+        return GenericExtent(self.bbox, self.temporal_interval).get_extent()
+
+    @classmethod
+    def from_files(cls, file_paths: List[str], max_workers: int = 16) -> "ExtentBuilder":
+        """
+        Create an ExtentBuilder covering the bboxes of all the given data files.
+        Only the bboxes are read, on up to max_workers threads, reading headers (remote ones 
+        in particular) is mostly waiting on I/O.
+        """
+        builder = cls()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            bboxes = np.array(
+                list(executor.map(MetaDataExtractorFactory.extract_bbox, file_paths)), 
+                dtype=np.float64
+                )
+        builder.update_bboxes(bboxes)
+
+        return builder
 
 def get_current_temporal_interval() -> list[datetime, datetime]:
     """
-    Update the temporal interval with a new datetime value.
-    Ensures datetime is timezone-aware.
+    Get a temporal interval that starts and ends at the current (timezone-aware) UTC time.
     """
-    datetime_value = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    return [now, now]
 
-    # Make datetime timezone-aware if it isn't already
-    if datetime_value.tzinfo is None:
-        datetime_value = datetime_value.replace(tzinfo=timezone.utc)
-        
-    temporal_interval = None
-
-    if temporal_interval is None:
-        temporal_interval = [datetime_value, datetime_value]
-    else:
-        temporal_interval = [
-            min(temporal_interval[0], datetime_value),
-            max(temporal_interval[1], datetime_value)
-        ]
-    return temporal_interval
+@functools.lru_cache(maxsize=1)
+def default_extent() -> Extent:
+    """
+    Get the global default Extent, built once per process and shared by every 
+    collection created without an explicit extent. Treat it as read-only.
+    """
+    return GenericExtent().get_extent()
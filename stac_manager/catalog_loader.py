@@ -1,16 +1,26 @@
-
+import os
+import re
+import functools
+import urllib.error
+import urllib.request
 import pystac
 
 from abc import ABC, abstractmethod
 import typing
 from typing import Dict, Any, Type
 
+from pystac.stac_io import DefaultStacIO
+
+from stac_manager.stac_io import PrefetchingStacIO
+
 class CatalogDataLoader(ABC):
 
     """
     Abstract base class for loading STAC catalog json.
     """
 
+    __slots__ = ('catalog_path',)
+
     def __init__(self, catalog_path):
         self.catalog_path = catalog_path
     
@@ -18,33 +28,106 @@ class CatalogDataLoader(ABC):
     def load_catalog(self) -> pystac.Catalog:
         pass
 
+    def exists(self) -> bool:
+        """
+        Cheap check for whether there is a catalog at catalog_path, used to skip 
+        a full load when a new catalog has to be created anyway.
+        Loaders that cannot check cheaply return True and let load_catalog() decide.
+        """
+        return True
+
 class LocalCatalogDataLoader(CatalogDataLoader):
 
+    __slots__ = ()
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.catalog_path)
+
     def load_catalog(self) -> pystac.Catalog:
+        """
+        Load a STAC catalog from a local file.
+        pystac parses the JSON with orjson when it is installed (pip install stac_manager[fast]).
+        :return: An instance of pystac.Catalog.
+        """
         return pystac.Catalog.from_file(self.catalog_path)
 
 class RemoteCatalogDataLoader(CatalogDataLoader):
     """
     Data loader for loading a STAC catalog from a remote URL.
     """
+    __slots__ = ('max_workers', 'timeout', '_validator')
+
+    def __init__(self, catalog_path, max_workers: int = 16, timeout: float = 5):
+        super().__init__(catalog_path)
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        # ETag (or Last-Modified) of the catalog from the last exists() check
+        self._validator: typing.Optional[str] = None
+
+    def exists(self) -> bool:
+        """
+        Check the catalog URL with a HEAD request instead of downloading it.
+        The response's ETag (or Last-Modified) is kept, so load_catalog() can reuse an 
+        unchanged catalog document that was already downloaded.
+        :return: True if the URL responds successfully.
+        """
+        self._validator = None
+        request = urllib.request.Request(self.catalog_path, method="HEAD")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                self._validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+                return response.status == 200
+        except urllib.error.HTTPError as e:
+            # server does not allow HEAD requests, let load_catalog() find out
+            return e.code == 405
+        except (urllib.error.URLError, ValueError):
+            return False
+
     def load_catalog(self) -> pystac.Catalog:
         """
         Load a STAC catalog from a remote URL.
+        The catalog's child catalogs/collections are fetched concurrently so resolving 
+        them afterwards does not pay one round trip per child. The catalog document itself is 
+        not downloaded again if exists() reported the same ETag (or Last-Modified) as an earlier load.
+        Every call returns a new pystac.Catalog, only the JSON text is shared.
         :return: An instance of pystac.Catalog.
         """
         # Ensure HTTP requests are allowed (e.g., using settings or additional configurations)
         if not self.catalog_path.startswith("http"):
             raise ValueError("The catalog_path must be a valid URL for a remote catalog.")
 
-        return pystac.Catalog.from_url(self.catalog_path)
+        stac_io = PrefetchingStacIO()
+        if self._validator:
+            stac_io.add_prefetched(
+                self.catalog_path, 
+                _read_remote_catalog_text(self.catalog_path, self._validator)
+                )
+
+        catalog = pystac.Catalog.from_file(self.catalog_path, stac_io=stac_io)
+
+        child_hrefs = [link.get_absolute_href() for link in catalog.get_child_links()]
+        stac_io.prefetch([href for href in child_hrefs if href], max_workers=self.max_workers)
+
+        return catalog
+
+@functools.lru_cache(maxsize=32)
+def _read_remote_catalog_text(url: str, validator: str) -> str:
+    """Download a remote catalog document, cached on its URL and ETag (or Last-Modified)"""
+    return DefaultStacIO().read_text_from_href(url)
+
+# matches the URI scheme (e.g. "https" in "https://...") at the start of a catalog path
+_SCHEME_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9+.\-]*)://')
 
 class CatalogLoaderFactory:
     """
     Factory class for creating CatalogDataLoader instances, supporting dependency injection and extensibility.
     Allows for the addition of new loader types without modifying this class.
+    Loaders are keyed by URI scheme, paths without a scheme are treated as local files.
     """
     loader_classes: Dict[str, Type[CatalogDataLoader]] = {
         'http': RemoteCatalogDataLoader,  
+        'https': RemoteCatalogDataLoader,  
         'file': LocalCatalogDataLoader,
         # 's3': S3CatalogDataLoader,
     }
@@ -56,11 +139,11 @@ class CatalogLoaderFactory:
         :param catalog_path: The catalog_path or URL to the catalog.
         :return: An instance of CatalogDataLoader.
         """
-        for protocol, loader_class in CatalogLoaderFactory.loader_classes.items():
-            if catalog_path.startswith(protocol):
-                return loader_class(catalog_path)
-    
-        return LocalCatalogDataLoader(catalog_path)
+        match = _SCHEME_RE.match(catalog_path)
+        scheme = match.group(1).lower() if match else 'file'
+
+        loader_class = CatalogLoaderFactory.loader_classes.get(scheme, LocalCatalogDataLoader)
+        return loader_class(catalog_path)
      
         # raise ValueError(f"No suitable loader found for catalog_path: {catalog_path}")
 
@@ -1,21 +1,40 @@
 
 import os
+import logging
+import threading
+from collections import deque
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import typing
 from typing import Dict, List, Optional
+from datetime import datetime, timezone
 
 import pystac 
 from pystac import Catalog, Collection, Item, Asset, MediaType, Extent, SpatialExtent, TemporalExtent
 
 from stac_manager.catalog_loader import get_catalog_loader, CatalogDataLoader, CatalogLoaderFactory
 from stac_manager.collection_manager import CollectionManager
+from stac_manager.data_models import IngestJob
 from stac_manager.item_manager import AbstractItem, ItemFactoryManager, RasterItem, VRTItem
-from stac_manager.catalog_extents import GenericExtent
+from stac_manager.catalog_extents import GenericExtent, ExtentBuilder
 from stac_manager.stac_metadata import Metadata, MetaDataExtractorFactory
+from stac_manager.stac_io import ThreadedWriteStacIO
 from stac_manager.constants import DEFAULT_ROOT_CATALOG_ID, \
         DEFAULT_ROOT_CATALOG_TITLE, \
         DEFAULT_ROOT_CATALOG_DESC
 
+logger = logging.getLogger(__name__)
+
+def _bounded_map(executor: ThreadPoolExecutor, fn, iterable, window: int):
+    """Like executor.map(), but only submits up to window calls ahead of the results consumed"""
+    pending = deque()
+    for arg in iterable:
+        pending.append(executor.submit(fn, arg))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
 class CatalogManager:
     def __init__(self, 
                  catalog_path: str, 
@@ -33,6 +52,19 @@ class CatalogManager:
         self.catalog_path = catalog_path
         self.catalog_loader = catalog_loader or CatalogLoaderFactory.create_loader(self.catalog_path)
         self.catalog = None
+
+        # collection ID -> pystac.Collection, saves resolving child links on every lookup.
+        # Built on first use, see _collections
+        self._collections_index: Optional[Dict[str, pystac.Collection]] = None
+
+        # IDs of collections whose extent update was deferred and no longer covers all their items
+        self._stale_extents: typing.Set[str] = set()
+
+        # collection ID -> {item ID: item} added or changed since the last save, see save_changes()
+        self._unsaved: Dict[str, Dict[str, pystac.Item]] = {}
+
+        # timestamp shared by every item created during an ingest session, see begin_ingest()
+        self._session_now: Optional[datetime] = None
         
         # Initialize factories
         self.metadata_extractor_factory = metadata_extractor_factory or MetaDataExtractorFactory()
@@ -44,12 +76,57 @@ class CatalogManager:
         self.set_catalog_title(title)
         self.set_catalog_description(description)
 
+    def __enter__(self) -> "CatalogManager":
+        self.begin_ingest()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.end_ingest()
+
+    def begin_ingest(self) -> None:
+        """
+        Start an ingest session. Until end_ingest() is called, items created without an 
+        explicit 'datetime' all get the (UTC) time the session started.
+        """
+        self._session_now = datetime.now(timezone.utc)
+
+    def end_ingest(self) -> None:
+        """End the current ingest session."""
+        self._session_now = None
+
     def _load_or_create_catalog(self) -> None:
-        try:
-            self.catalog = self.catalog_loader.load_catalog()
-        except:
+        if self.catalog_loader.exists():
+            try:
+                self.catalog = self.catalog_loader.load_catalog()
+            except Exception as e:
+                logger.warning(f"Failed to load catalog from {self.catalog_path}, creating a new root catalog: {e}")
+                self.catalog = self._create_root_catalog()
+        else:
             self.catalog = self._create_root_catalog()
+
+        self._collections_index = None
         return 
+
+    @property
+    def _collections(self) -> Dict[str, pystac.Collection]:
+        """
+        Index of the catalog's collections by ID. Child links are only resolved on the first 
+        lookup, so a missing or broken child doesn't stop the catalog from loading.
+        """
+        if self._collections_index is None:
+            self._collections_index = {
+                child.id: child for child in self.catalog.get_children()
+                if isinstance(child, pystac.Collection)
+            }
+        return self._collections_index
+
+    def invalidate_collection_index(self) -> None:
+        """
+        Drop the collection index, it is rebuilt from the catalog's children on the next lookup. 
+        Call this after adding or removing children on the pystac catalog directly.
+        """
+        self._collections_index = None
+        return
                     
     def _create_root_catalog(self) -> pystac.Catalog:
         root_catalog = pystac.Catalog(
@@ -61,6 +138,8 @@ class CatalogManager:
         return root_catalog
     
     def get_catalog(self) -> pystac.Catalog:
+        # the caller can change the catalog's children, so the index is rebuilt on the next lookup
+        self.invalidate_collection_index()
         return self.catalog
 
     def set_catalog_id(self, id: str) -> None:
@@ -97,22 +176,27 @@ class CatalogManager:
                            description: str,
                            extent: Extent = None
                            ) -> None:
+        # check if collection is already present before building a new one
+        if self._collection_exists(collection_id): 
+            return
+
         collection = CollectionManager(
             collection_id=collection_id,
             title=title,
             description=description,
             extent=extent
-        )
+        ).get_collection()
 
-        # check if collection is already present
-        if not self._collection_exists(collection_id): 
-            self.catalog.add_child(collection.get_collection())
+        self.catalog.add_child(collection)
+        self._collections[collection_id] = collection
+        self._mark_unsaved(collection_id)
 
         return 
 
     def add_item_to_collection(self, 
                    collection_id: str,
                    data_path: str,
+                   defer_extent_update: bool = False,
                    **kwargs) -> None:
         """
         Create a STAC Item and add it to the specified collection.
@@ -121,63 +205,366 @@ class CatalogManager:
         Args:
             collection_id (str): ID of the collection to add the item to
             data_path (str): Path to the data file
+            defer_extent_update (bool): If True, skip recomputing the collection extent.
+                                The extent is recomputed for all collections in save_catalog()
             **kwargs: Additional arguments to pass to the item factory
             
         Returns:
             None
         """
-        # Infer data type from file extension
-        data_type = Path(data_path).suffix.lower()
-        # data_type = Path(data_path).suffix.lower().lstrip('.')
-        
         try:
-            # Get the appropriate factory
-            factory = self.item_factory_manager.get_item_factory(data_type)
+            # Find the collection to add the item to
+            collection = self.get_collection_by_id(collection_id)
+
+            if not collection:
+                raise ValueError(f"Collection not found: {collection_id}")
+
+            # a collection without items still has its initial extent, which must be replaced by the items extent
+            has_items = collection.get_single_link(pystac.RelType.ITEM) is not None
+
+            item = self._create_and_attach_item(collection, data_path, **kwargs)
+
+            if defer_extent_update:
+                self._stale_extents.add(collection_id)
+                return
+
+            # update extent based on items, unless the new item already falls inside of the current extent
+            if has_items and collection_id not in self._stale_extents and self._extent_contains_item(collection.extent, item):
+                return
+
+            collection.update_extent_from_items()
+            self._stale_extents.discard(collection_id)
+
+            return 
             
-            # Create the item
-            item = factory.create_item(data_path, **kwargs)
+        except ValueError as e:
+            raise ValueError(f"Error creating item: {str(e)}")
+
+    def add_items_to_collection(self, 
+                   collection_id: str,
+                   data_paths: List[str],
+                   **kwargs) -> None:
+        """
+        Create a STAC Item for each data path and add them to the specified collection.
+        The collection extent is updated once after all items have been added.
+        If any item cannot be created the collection is left unchanged.
+        
+        Args:
+            collection_id (str): ID of the collection to add the items to
+            data_paths (List[str]): Paths to the data files
+            **kwargs: Additional arguments to pass to the item factory for every item
             
-            # Find the collection and add the item
+        Returns:
+            None
+        """
+        try:
             collection = self.get_collection_by_id(collection_id)
 
             if not collection:
                 raise ValueError(f"Collection not found: {collection_id}")
 
-            # set collection id for the item
-            item.collection = collection.id 
+            # create every item before attaching any, so a failure doesn't leave part of the batch attached
+            items = [self._create_batch_item(data_path, **kwargs) for data_path in data_paths]
+            for item in items:
+                self._attach_item(collection, item)
 
-            # Add item to collection and update extent basd on items
-            collection.add_item(item)
             collection.update_extent_from_items()
+            self._stale_extents.discard(collection_id)
 
-            # return item
             return 
+
+        except ValueError as e:
+            raise ValueError(f"Error creating item: {str(e)}")
+
+    def add_items_parallel(self, 
+                   collection_id: str,
+                   data_paths: List[str],
+                   max_workers: int = 8,
+                   **kwargs) -> None:
+        """
+        Create STAC Items for a batch of data paths using a thread pool and add them to the specified collection.
+        Metadata extraction (rasterio / GDAL reads) runs concurrently, items are attached to the 
+        collection on the calling thread and the collection extent is updated once at the end.
+        If any item cannot be created the collection is left unchanged.
+        
+        Args:
+            collection_id (str): ID of the collection to add the items to
+            data_paths (List[str]): Paths to the data files
+            max_workers (int): Maximum number of threads used to create items
+            **kwargs: Additional arguments to pass to the item factory for every item
             
+        Returns:
+            None
+        """
+        try:
+            collection = self.get_collection_by_id(collection_id)
+
+            if not collection:
+                raise ValueError(f"Collection not found: {collection_id}")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                items = list(executor.map(lambda data_path: self._create_batch_item(data_path, **kwargs), data_paths))
+
+            # pystac objects are not thread safe, so items are attached on this thread
+            for item in items:
+                self._attach_item(collection, item)
+
+            collection.update_extent_from_items()
+            self._stale_extents.discard(collection_id)
+
+            return 
+
         except ValueError as e:
             raise ValueError(f"Error creating item: {str(e)}")
 
+    def stream_items_to_collection(self,
+                   collection_id: str,
+                   data_paths: List[str],
+                   max_workers: int = 8,
+                   catalog_type: pystac.CatalogType = pystac.CatalogType.SELF_CONTAINED,
+                   **kwargs) -> None:
+        """
+        Create STAC Items for a batch of data paths and write each item's JSON file as soon as it is created,
+        the collection only keeps a link to the file so memory use does not grow with the number of items.
+        Only a few items per worker are created ahead of the ones being written. The collection extent is 
+        expanded to cover the new items, then the collection and any other unsaved changes are written 
+        with save_changes(). As with save_catalog(), the catalog's catalog_type is set to catalog_type.
+
+        Args:
+            collection_id (str): ID of the collection to add the items to
+            data_paths (List[str]): Paths to the data files
+            max_workers (int): Maximum number of threads used to create items
+            catalog_type (pystac.CatalogType): Catalog type the JSON files are written with
+            **kwargs: Additional arguments to pass to the item factory for every item
+
+        Returns:
+            None
+        """
+        if not isinstance(catalog_type, pystac.CatalogType):
+            raise ValueError(f"Invalid catalog type: {catalog_type}, expected pystac.CatalogType")
+
+        collection = self.get_collection_by_id(collection_id)
+
+        if not collection:
+            raise ValueError(f"Collection not found: {collection_id}")
+
+        if collection_id in self._stale_extents:
+            collection.update_extent_from_items()
+            self._stale_extents.discard(collection_id)
+
+        # a collection without items still has its initial extent, which must be replaced by the items extent
+        has_items = collection.get_single_link(pystac.RelType.ITEM) is not None
+
+        # item hrefs are derived from the collection href, unresolved items are left as they are
+        self.catalog.catalog_type = catalog_type
+        self.catalog.normalize_hrefs(self.catalog_path, skip_unresolved=True)
+        collection_dir = os.path.dirname(collection.get_self_href())
+
+        # same self link rule as pystac.Catalog.save()
+        absolute = catalog_type == pystac.CatalogType.ABSOLUTE_PUBLISHED
+
+        extent_builder = ExtentBuilder()
+        start = end = None
+        window = 2 * max_workers
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                    ThreadedWriteStacIO(max_pending=window) as stac_io:
+                items = _bounded_map(executor, lambda data_path: self._create_batch_item(data_path, **kwargs), data_paths, window)
+
+                # pystac objects are not thread safe, so items are attached on this thread
+                for item in items:
+                    item.collection = collection.id
+                    link = collection.add_item(item)
+
+                    item.set_self_href(os.path.join(collection_dir, item.id, f"{item.id}.json"))
+                    item.save_object(include_self_link=absolute, stac_io=stac_io)
+
+                    if item.bbox is not None:
+                        extent_builder.update_bbox(item.bbox)
+                    if item.datetime is not None:
+                        start = item.datetime if start is None else min(start, item.datetime)
+                        end = item.datetime if end is None else max(end, item.datetime)
+
+                    # swap the item link (appended last) for an unresolved one, so the item can be garbage collected
+                    collection.links[-1] = pystac.Link(
+                        pystac.RelType.ITEM, item.get_self_href(), media_type=link.media_type
+                    ).set_owner(collection)
+
+                    # an earlier, unsaved version of the item is replaced by the file just written
+                    self._unsaved.get(collection_id, {}).pop(item.id, None)
+
+        except Exception as e:
+            # part of the batch may be linked already, its extent is recomputed on the next save
+            self._stale_extents.add(collection_id)
+            self._mark_unsaved(collection_id)
+            if isinstance(e, ValueError):
+                raise ValueError(f"Error creating item: {str(e)}")
+            raise
+
+        if extent_builder.bbox is not None:
+            if has_items:
+                extent_builder.update_bbox(collection.extent.spatial.bboxes[0])
+                current_start, current_end = collection.extent.temporal.intervals[0]
+                start = current_start if current_start is None or start is None else min(start, current_start)
+                end = current_end if current_end is None or end is None else max(end, current_end)
+            extent_builder.temporal_interval = [start, end] if start is not None else None
+            collection.extent = extent_builder.build()
+
+        # writes the collection, the root catalog and every other collection changed since the last save
+        self._mark_unsaved(collection_id)
+        self.save_changes(catalog_type)
+        return
+
+    def ingest(self,
+               jobs: List[IngestJob],
+               max_workers: int = 8,
+               **kwargs) -> None:
+        """
+        Add a batch of collections and their items. Items for every job are created 
+        concurrently first, then each job's collection is added (if it doesn't exist yet), 
+        its items are attached on the calling thread and its extent is updated once.
+        If any item cannot be created the catalog is left unchanged.
+        
+        Args:
+            jobs (List[IngestJob]): Collections and the data paths to add to each of them
+            max_workers (int): Maximum number of threads used to create items
+            **kwargs: Additional arguments to pass to the item factory for every item, 
+                      a job's properties are added to the item properties of that job 
+                      and a job's item_ids are used as the IDs of its items
+            
+        Returns:
+            None
+        """
+        def create_job_item(job_path) -> pystac.Item:
+            job, index, data_path = job_path
+            properties = {**kwargs.get('properties', {}), **job.properties}
+            item_kwargs = {**kwargs, 'properties': properties}
+            if job.item_ids:
+                item_kwargs['item_id'] = job.item_ids[index]
+            return self._create_batch_item(data_path, **item_kwargs)
+
+        job_paths = [(job, index, data_path) for job in jobs for index, data_path in enumerate(job.data_paths)]
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                items = iter(list(executor.map(create_job_item, job_paths)))
+        except ValueError as e:
+            raise ValueError(f"Error creating item: {str(e)}")
+
+        for job in jobs:
+            self.add_child_collection(
+                collection_id=job.collection_id,
+                title=job.title,
+                description=job.description
+            )
+            collection = self._collections[job.collection_id]
+
+            # pystac objects are not thread safe, so items are attached on this thread
+            for _ in job.data_paths:
+                self._attach_item(collection, next(items))
+
+            collection.update_extent_from_items()
+            self._stale_extents.discard(job.collection_id)
+
+        return
+
+    def create_item(self, data_path: str, **kwargs) -> pystac.Item:
+        """
+        Create a STAC Item from a data path using the factory for its file extension.
+        The item is not added to the catalog, so this can be called from worker threads 
+        as long as the items are added to collections on a single thread.
+        """
+        if self._session_now is not None and 'datetime' not in kwargs:
+            kwargs['datetime'] = self._session_now
+
+        # Get the appropriate factory for the file extension and create the item
+        factory = self.item_factory_manager.get_item_factory_for_path(data_path)
+        return factory.create_item(data_path, **kwargs)
+
+    def _create_batch_item(self, data_path: str, **kwargs) -> pystac.Item:
+        """
+        create_item() for the batch methods. Any error reading the file (rasterio, network, 
+        malformed VRT XML, ...) is raised as a ValueError naming the data path.
+        """
+        try:
+            return self.create_item(data_path, **kwargs)
+        except Exception as e:
+            raise ValueError(f"{data_path}: {str(e)}") from e
+
+    def _attach_item(self, collection: pystac.Collection, item: pystac.Item) -> None:
+        """Add a STAC Item to the given collection"""
+        # set collection id for the item
+        item.collection = collection.id 
+
+        collection.add_item(item)
+        self._mark_unsaved(collection.id, item)
+        return
+
+    def _create_and_attach_item(self, 
+                                collection: pystac.Collection,
+                                data_path: str,
+                                **kwargs) -> pystac.Item:
+        """Create a STAC Item from a data path and add it to the given collection"""
+        item = self.create_item(data_path, **kwargs)
+        self._attach_item(collection, item)
+
+        return item
+
     def remove_collection(self, collection_id: str) -> None:
         """Remove a collection from the catalog by ID"""
         collection = self.get_collection_by_id(collection_id)
         if collection:
             self.catalog.remove_child(collection_id)
+            del self._collections[collection_id]
+            self._unsaved.pop(collection_id, None)
         else:
             raise ValueError(f"Collection not found: {collection_id}")
         return
 
     def remove_item_from_collection(self, collection_id: str, item_id: str) -> None:
         """Remove an item from a collection by ID"""
+        self.remove_items_from_collection(collection_id, [item_id])
+        return
+
+    def remove_items_from_collection(self, collection_id: str, item_ids: List[str]) -> None:
+        """
+        Remove a batch of items from a collection by ID, in a single pass over the collection's links.
+        Item links after the last removed item are not resolved. The collection extent is updated 
+        once after all items have been removed. If any item is not found nothing is removed.
+        """
         collection = self.get_collection_by_id(collection_id)
         if not collection:
             raise ValueError(f"Collection not found: {collection_id}")
-        
-        item = collection.get_item(item_id)
-        if item:
-            collection.remove_item(item_id)
-            # Update collection extent after removing item
-            collection.update_extent_from_items()
-        else:
-            raise ValueError(f"Item not found: {item_id} in collection {collection_id}")
+
+        remaining = set(item_ids)
+        removed_items = []
+        new_links = []
+        root = collection.get_root()
+
+        for link in collection.links:
+            if remaining and link.rel == pystac.RelType.ITEM:
+                item = link.resolve_stac_object(root=root).target
+                if item.id in remaining:
+                    remaining.discard(item.id)
+                    removed_items.append(item)
+                    continue
+            new_links.append(link)
+
+        if remaining:
+            raise ValueError(f"Item not found: {', '.join(sorted(remaining))} in collection {collection_id}")
+
+        collection.links = new_links
+        for item in removed_items:
+            item.set_parent(None)
+            item.set_root(None)
+
+        # Update collection extent after removing items
+        collection.update_extent_from_items()
+        self._mark_unsaved(collection_id)
+        for item in removed_items:
+            self._unsaved[collection_id].pop(item.id, None)
+
         return
 
     def update_item_properties(self, 
@@ -203,6 +590,7 @@ class CatalogManager:
         # Update existing properties and add new ones
         for key, value in properties.items():
             item.properties[key] = value
+        self._mark_unsaved(collection_id, item)
         
         return
     
@@ -229,6 +617,7 @@ class CatalogManager:
         for key in property_keys:
             if key in item.properties:
                 del item.properties[key]
+        self._mark_unsaved(collection_id, item)
         
         return
 
@@ -253,6 +642,7 @@ class CatalogManager:
             if filter_fn is None or filter_fn(item):
                 for key, value in properties.items():
                     item.properties[key] = value
+                self._mark_unsaved(collection_id, item)
         
         return
 
@@ -278,6 +668,7 @@ class CatalogManager:
                 for key in property_keys:
                     if key in item.properties:
                         del item.properties[key]
+                self._mark_unsaved(collection_id, item)
         
         return
 
@@ -301,36 +692,152 @@ class CatalogManager:
 
     def _update_all_collection_extents(self) -> None:
         """Update the spatial and temporal extents of all collections"""
-        for child in self.catalog.get_children():
-            if isinstance(child, pystac.Collection):
-                child.update_extent_from_items()
+        for collection in self._collections.values():
+            collection.update_extent_from_items()
+        self._stale_extents.clear()
+        return
+
+    @staticmethod
+    def _extent_contains_item(extent: pystac.Extent, item: pystac.Item) -> bool:
+        """Check if an item's bbox and datetime fall within an extent (first bbox and interval only)"""
+        if item.bbox is None or len(item.bbox) != 4 or item.datetime is None:
+            return False
+
+        bbox = extent.spatial.bboxes[0]
+        if len(bbox) != 4:
+            return False
+
+        xmin, ymin, xmax, ymax = bbox
+        if not (item.bbox[0] >= xmin and item.bbox[1] >= ymin and item.bbox[2] <= xmax and item.bbox[3] <= ymax):
+            return False
+
+        start, end = extent.temporal.intervals[0]
+        try:
+            return (start is None or start <= item.datetime) and (end is None or item.datetime <= end)
+        except TypeError:
+            # comparing timezone naive and aware datetimes
+            return False
+
+    def _mark_unsaved(self, collection_id: str, item: Optional[pystac.Item] = None) -> None:
+        """Record a collection (and optionally one of its items) as changed since the last save"""
+        unsaved_items = self._unsaved.setdefault(collection_id, {})
+        if item is not None:
+            unsaved_items[item.id] = item
         return
 
     def get_collection_by_id(self, collection_id: str) -> Optional[pystac.Collection]:
         """Find a collection in the catalog by ID"""
-        for child in self.catalog.get_children():
-            if isinstance(child, pystac.Collection) and child.id == collection_id:
-                return child
-        return None
+        return self._collections.get(collection_id)
 
     def _collection_exists(self, collection_id: str) -> bool:
         """Check if a collection exists in the catalog"""
-        for child in self.catalog.get_children():
-            if isinstance(child, pystac.Collection) and child.id == collection_id:
-                return True
-        return False
+        return collection_id in self._collections
 
-    def save_catalog(self, catalog_type : pystac.CatalogType = pystac.CatalogType.SELF_CONTAINED) -> None:
-        """Save the catalog to disk"""
+    def save_catalog(self, 
+                     catalog_type : pystac.CatalogType = pystac.CatalogType.SELF_CONTAINED, 
+                     max_workers: Optional[int] = None
+                     ) -> None:
+        """
+        Save the catalog to disk.
+        JSON files are written on up to max_workers threads (default: ThreadedWriteStacIO's default).
+        """
         if not isinstance(catalog_type, pystac.CatalogType):
             raise ValueError(f"Invalid catalog type: {catalog_type}, expected pystac.CatalogType")
 
         self._update_all_collection_extents()
 
         self.catalog.normalize_hrefs(self.catalog_path)
-        self.catalog.save(catalog_type=catalog_type)
+
+        # item/collection JSON files are independent, so they are written concurrently
+        with ThreadedWriteStacIO(max_workers=max_workers) as stac_io:
+            self.catalog.save(catalog_type=catalog_type, stac_io=stac_io)
+
+        self._unsaved.clear()
+        return
+
+    def save_changes(self, catalog_type : pystac.CatalogType = pystac.CatalogType.SELF_CONTAINED) -> None:
+        """
+        Write only the collections and items added or changed through this manager since the 
+        last save_catalog() or save_changes(), and the root catalog. Items that were loaded from 
+        disk and not changed are neither resolved nor rewritten. Falls back to save_catalog() if 
+        the catalog has not been saved before or the catalog type changes.
+        """
+        if not isinstance(catalog_type, pystac.CatalogType):
+            raise ValueError(f"Invalid catalog type: {catalog_type}, expected pystac.CatalogType")
+
+        if self.catalog.get_self_href() is None or self.catalog.catalog_type != catalog_type:
+            self.save_catalog(catalog_type)
+            return
+
+        # collections with deferred extent updates have unsaved items, so they are written below
+        for collection_id in self._stale_extents:
+            if collection_id in self._collections:
+                self._collections[collection_id].update_extent_from_items()
+        self._stale_extents.clear()
+
+        # only sets hrefs of objects already in memory, unresolved (unchanged) items are skipped
+        self.catalog.normalize_hrefs(self.catalog_path, skip_unresolved=True)
+
+        # same self link rules as pystac.Catalog.save()
+        absolute = catalog_type == pystac.CatalogType.ABSOLUTE_PUBLISHED
+        root_self_link = catalog_type != pystac.CatalogType.SELF_CONTAINED
+
+        with ThreadedWriteStacIO() as stac_io:
+            for collection_id, items in self._unsaved.items():
+                collection = self._collections.get(collection_id)
+                if collection is None:
+                    continue
+                for item in items.values():
+                    item.save_object(include_self_link=absolute, stac_io=stac_io)
+                collection.save_object(include_self_link=absolute, stac_io=stac_io)
+            self.catalog.save_object(include_self_link=root_self_link, stac_io=stac_io)
+
+        self._unsaved.clear()
+        return
+
+    def save_index(self, catalog_type : pystac.CatalogType = pystac.CatalogType.SELF_CONTAINED) -> None:
+        """
+        Write only the root catalog and collection JSON files, without writing items 
+        or recomputing collection extents. Collection extents are saved as they currently are, 
+        which can be stale if extent updates were deferred. Follow up with save_catalog() 
+        or save_full() to write the items.
+        """
+        if not isinstance(catalog_type, pystac.CatalogType):
+            raise ValueError(f"Invalid catalog type: {catalog_type}, expected pystac.CatalogType")
+
+        # only sets hrefs of objects already in memory, items are not read from disk
+        self.catalog.normalize_hrefs(self.catalog_path, skip_unresolved=True)
+        self.catalog.catalog_type = catalog_type
+
+        # same self link rules as pystac.Catalog.save()
+        absolute = catalog_type == pystac.CatalogType.ABSOLUTE_PUBLISHED
+        root_self_link = catalog_type != pystac.CatalogType.SELF_CONTAINED
+
+        with ThreadedWriteStacIO() as stac_io:
+            for collection in self._collections.values():
+                collection.save_object(include_self_link=absolute, stac_io=stac_io)
+            self.catalog.save_object(include_self_link=root_self_link, stac_io=stac_io)
         return
 
+    def save_full(self, catalog_type : pystac.CatalogType = pystac.CatalogType.SELF_CONTAINED) -> threading.Thread:
+        """
+        Run save_catalog() on a background thread and return the thread. 
+        The thread is not a daemon, so the interpreter waits for the save to finish before exiting.
+        The catalog must not be modified until the thread has finished (thread.join()).
+        """
+        if not isinstance(catalog_type, pystac.CatalogType):
+            raise ValueError(f"Invalid catalog type: {catalog_type}, expected pystac.CatalogType")
+
+        thread = threading.Thread(target=self._background_save, args=(catalog_type,), daemon=False)
+        thread.start()
+        return thread
+
+    def _background_save(self, catalog_type: pystac.CatalogType) -> None:
+        try:
+            self.save_catalog(catalog_type)
+        except Exception:
+            logger.exception("Background save of catalog at %s failed", self.catalog_path)
+
 def setup_catalog_manager(catalog_path: str, catalog_loader: CatalogDataLoader):
     """Setup a catalog manager with default configurations"""
     metadata_extractor_factory = MetaDataExtractorFactory()
@@ -3,11 +3,13 @@ import os
 import pystac 
 from pystac import Catalog, Collection, Extent, SpatialExtent, TemporalExtent
 
-from stac_manager.catalog_extents import GenericExtent
+from stac_manager.catalog_extents import GenericExtent, default_extent
 
 # TODO: This needs to be looked at more, but i think this is the right direction 
 class CollectionManager:
 
+    __slots__ = ('collection_id', 'title', 'description', 'extent', 'collection')
+
     def __init__(self, 
                  collection_id:str, 
                  title: str ,
@@ -17,7 +19,7 @@ class CollectionManager:
         self.collection_id = collection_id if collection_id else "Default collection id"
         self.title = title if title else "Default collection title"
         self.description = description if description else "Default collection description"
-        self.extent = extent if extent else GenericExtent().get_extent()
+        self.extent = extent if extent else default_extent()
         self.collection = None
         self.create_collection()
     
@@ -1,20 +1,44 @@
 import os
+from types import MappingProxyType
 from pystac import MediaType
 
 DEFAULT_ROOT_CATALOG_ID    = "root-catalog"
 DEFAULT_ROOT_CATALOG_TITLE = f"{DEFAULT_ROOT_CATALOG_ID}-title"
 DEFAULT_ROOT_CATALOG_DESC  = f"{DEFAULT_ROOT_CATALOG_ID}-desc" 
 
-# mapping common file extensions to PySTAC MediaType enums
-FILE_EXT_TO_MEDIA_TYPE = {
-    # ".tif": MediaType.COG,  
+# GDAL config options used when opening rasters for metadata extraction
+# - skip listing the parent directory for sidecar files on every open (expensive on /vsicurl/ and /vsis3/)
+# - cache remote reads so repeated header reads are served from memory
+# - reuse HTTP/2 connections for the many small range reads of a header
+# - skip the HEAD request before the first read of a remote file, and merge adjacent range reads into one request
+# - size of GDAL's process wide cache of remote file chunks in bytes, shared by every remote file read
+# - block cache size in MB, unless GDAL_CACHEMAX is already set in the environment
+# rasterio.Env is thread local, the extractors enter these options around every open 
+# so they also apply to files read on worker threads
+GDAL_CONFIG_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "VSI_CACHE": "TRUE",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_VERSION": "2",
+    "CPL_VSIL_CURL_USE_HEAD": "NO",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "CPL_VSIL_CURL_CACHE_SIZE": 256_000_000,
+}
+if "GDAL_CACHEMAX" not in os.environ:
+    GDAL_CONFIG_OPTIONS["GDAL_CACHEMAX"] = 512
+
+# treat ".tif" files as Cloud Optimized GeoTIFFs, set to False to label them as plain TIFFs
+TIF_AS_COG = True
+
+# mapping common file extensions to PySTAC MediaType enums (read-only)
+FILE_EXT_TO_MEDIA_TYPE = MappingProxyType({
     ".cog": MediaType.COG,
     ".fgb": MediaType.FLATGEOBUF,
     ".geojson": MediaType.GEOJSON,
     ".gpkg": MediaType.GEOPACKAGE,
     ".geotiff": MediaType.GEOTIFF,
     ".tiff": MediaType.TIFF,
-    ".tif": MediaType.TIFF,
+    ".tif": MediaType.COG if TIF_AS_COG else MediaType.TIFF,
     ".hdf": MediaType.HDF,
     ".h5": MediaType.HDF5,
     ".html": MediaType.HTML,
@@ -30,4 +54,4 @@ FILE_EXT_TO_MEDIA_TYPE = {
     ".pdf": MediaType.PDF,
     ".zarr": MediaType.ZARR,
     ".nc": MediaType.NETCDF,  
-}
+})
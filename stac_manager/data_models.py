@@ -1,9 +1,11 @@
 from typing import Dict, List, Optional, Tuple, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass(init=True)
 class STACCollectionSource:
     """Class for defining a STAC Data source"""
+    __slots__ = ("id", "title", "description")
+
     id : Union[str, int]
     title: str
     description : str
@@ -11,7 +13,22 @@ class STACCollectionSource:
 @dataclass(init=True)
 class STACItemSource:
     """Class for defining a STAC Item's Data source"""
+    __slots__ = ("collection_id", "id", "data_path", "properties")
+
     collection_id : Union[str, int]
     id : Union[str, int]
     data_path : str
     properties : Dict[str, Union[str, int, float]]
+
+@dataclass(init=True)
+class IngestJob:
+    """
+    Class for defining a collection and the data files to add to it as items.
+    item_ids are the IDs of the items in data_paths order, the file names are used when it is empty
+    """
+    collection_id : str
+    title : str
+    description : str
+    data_paths : List[str]
+    properties : Dict[str, Union[str, int, float]] = field(default_factory=dict)
+    item_ids : List[str] = field(default_factory=list)
@@ -4,7 +4,7 @@ from os.path import basename, join
 from pathlib import Path
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pystac
 from pystac import Item, Asset, MediaType
@@ -27,7 +27,25 @@ class AbstractItem(ABC):
     @classmethod
     def _get_file_name(cls, data_path: str) -> str:
         # return Path(data_path).stem
-        return basename(data_path).split(".")[0]
+        # everything before the first ".", partition avoids building a list of all the parts
+        return basename(data_path).partition(".")[0]
+
+    @classmethod
+    def _get_asset_key(cls, data_path: str) -> str:
+        # Use the filename without extension as the asset key
+        # if not possible, just use the data_path
+        try:
+            return cls._get_file_name(data_path)
+        except Exception:
+            return data_path
+
+    @classmethod
+    def _get_datetime(cls, **kwargs) -> datetime:
+        # only fall back to the current (UTC) time when no datetime was given, 
+        # pystac writes naive datetimes as if they were UTC
+        if 'datetime' in kwargs:
+            return kwargs['datetime']
+        return datetime.now(timezone.utc)
 
 class RasterItem(AbstractItem):
     """Concrete factory for creating STAC Items from Raster data"""
@@ -36,8 +54,7 @@ class RasterItem(AbstractItem):
         self.metadata_extractor = metadata_extractor
 
     def create_item(self, data_path: str, **kwargs) -> pystac.Item:
-        extractor = self.metadata_extractor.get_metadata_extractor(data_path)
-        metadata = extractor.extract_metadata()
+        metadata = self.metadata_extractor.extract_metadata(data_path)
         
         # Create STAC Item
         item_id = kwargs.get("item_id", self._get_file_name(data_path))
@@ -47,8 +64,8 @@ class RasterItem(AbstractItem):
             id=item_id,
             geometry=metadata.get('geometry'),
             bbox=metadata.get('bbox'),
-            stac_extensions=metadata.get('stac_extensions', []),
-            datetime=kwargs.get('datetime', datetime.now()),
+            stac_extensions=list(metadata.get('stac_extensions', [])),
+            datetime=self._get_datetime(**kwargs),
             properties={**kwargs.get('properties', {}), **metadata.get('properties', {})}
         )
 
@@ -65,10 +82,7 @@ class RasterItem(AbstractItem):
         
         # Use the filename without extension as the asset key
         # if not possible, just use the data_path
-        try:
-            asset_key = self._get_file_name(data_path)
-        except Exception as e:
-            asset_key = data_path
+        asset_key = self._get_asset_key(data_path)
         
         return {
             asset_key: pystac.Asset(
@@ -87,24 +101,23 @@ class VRTItem(AbstractItem):
 
     def create_item(self, data_path: str, **kwargs) -> pystac.Item:
         # Extract metadata using the VRT-specific extractor
-        extractor = self.metadata_extractor.get_metadata_extractor(data_path)
-        metadata = extractor.extract_metadata()
+        metadata = self.metadata_extractor.extract_metadata(data_path)
         
         # Create STAC Item
         item_id = kwargs.get("item_id", self._get_file_name(data_path))
         
         # Create item with VRT-specific properties
-        properties = metadata.get('properties', {})
-        properties.update({
+        properties = {
+            **metadata.get('properties', {}),
             'vrt:source_count': len(metadata.get('vrt_files', [])),
             'vrt:type': 'mosaic'  # Could be parameterized based on VRT type
-        })
+        }
         item = pystac.Item(
             id=item_id,
             geometry=metadata.get('geometry'),
             bbox=metadata.get('bbox'),
-            stac_extensions=metadata.get('stac_extensions', []),
-            datetime=kwargs.get('datetime', datetime.now()),
+            stac_extensions=list(metadata.get('stac_extensions', [])),
+            datetime=self._get_datetime(**kwargs),
             properties={**kwargs.get('properties', {}), **properties} 
         )
         
@@ -128,24 +141,20 @@ class VRTItem(AbstractItem):
         
         # Add source files as separate assets
         vrt_files = metadata.get('vrt_files', [])
-        for idx, source_file in enumerate(vrt_files):
-            media_type = MetaDataExtractor.get_media_type(source_file)
-            
-            try:
-                asset_key = self._get_file_name(source_file)
-                # asset_key = f'source_{idx}'
-            except Exception as e:
-                asset_key = source_file
-
-            assets[asset_key] = Asset(
+        get_media_type = MetaDataExtractor.get_media_type
+        get_asset_key = self._get_asset_key
+        assets.update({
+            asset_key: Asset(
                 href=source_file,
-                media_type=media_type,
+                media_type=get_media_type(source_file),
                 roles=['source'],
                 title=f'Source {asset_key}',
                 description=f'Source file {asset_key} referenced by the VRT'
                 # title=f'Source {idx + 1}',
                 # description=f'Source file {idx + 1} referenced by the VRT'
             )
+            for asset_key, source_file in ((get_asset_key(f), f) for f in vrt_files)
+        })
         
         return assets
 
@@ -157,8 +166,7 @@ class CatalogJsonItem(AbstractItem):
 
     def create_item(self, data_path: str, **kwargs) -> pystac.Item:
         # Extract metadata using the STAC Catalog JSON -specific extractor
-        extractor = self.metadata_extractor.get_metadata_extractor(data_path)
-        metadata  = extractor.extract_metadata()
+        metadata  = self.metadata_extractor.extract_metadata(data_path)
         
         # Create STAC Item
         item_id = metadata.get('id', self._get_file_name(data_path))
@@ -170,8 +178,8 @@ class CatalogJsonItem(AbstractItem):
             id=item_id,
             geometry=metadata.get('geometry'),
             bbox=metadata.get('bbox'),
-            stac_extensions=metadata.get('stac_extensions', []),
-            datetime=kwargs.get('datetime', datetime.now()),
+            stac_extensions=list(metadata.get('stac_extensions', [])),
+            datetime=self._get_datetime(**kwargs),
             properties={**kwargs.get('properties', {}), **properties} 
         )
 
@@ -216,8 +224,7 @@ class NetCDFItem(AbstractItem):
         self.metadata_extractor = metadata_extractor
 
     def create_item(self, data_path: str, **kwargs) -> pystac.Item:
-        extractor = self.metadata_extractor.get_metadata_extractor(data_path)
-        metadata = extractor.extract_metadata()
+        metadata = self.metadata_extractor.extract_metadata(data_path)
         
         # Create STAC Item
         item_id = kwargs.get("item_id", self._get_file_name(data_path))
@@ -226,8 +233,8 @@ class NetCDFItem(AbstractItem):
             id=item_id,
             geometry=metadata.get('geometry'),
             bbox=metadata.get('bbox'),
-            stac_extensions=metadata.get('stac_extensions', []),
-            datetime=kwargs.get('datetime', datetime.now()),
+            stac_extensions=list(metadata.get('stac_extensions', [])),
+            datetime=self._get_datetime(**kwargs),
             properties={**kwargs.get('properties', {}), **metadata.get('properties', {})}
         )
 
@@ -243,11 +250,7 @@ class NetCDFItem(AbstractItem):
         
         # Use the filename without extension as the asset key
         # if not possible, just use the data_path
-        try:
-            asset_key = self._get_file_name(data_path)
-            # asset_key = Path(data_path).stem
-        except Exception as e:
-            asset_key = data_path
+        asset_key = self._get_asset_key(data_path)
         
         return {
             asset_key: pystac.Asset(
@@ -275,6 +278,9 @@ class ItemFactoryManager:
     def __init__(self, metadata_extractor_factory: MetaDataExtractorFactory):
         self.metadata_extractor_factory = metadata_extractor_factory
 
+        # factories only hold the metadata extractor factory, so one instance per class is reused
+        self._factories: Dict[type, AbstractItem] = {}
+
     @classmethod
     def register_factory(cls, data_type: str, factory_class: type):
         """Register a new factory class for a data type"""
@@ -299,7 +305,38 @@ class ItemFactoryManager:
                 f"Unsupported data type: {data_type}. "
                 f"Supported types: {list(self._factory_mapping.keys())}"
             )
-        return factory_class(self.metadata_extractor_factory)
+
+        factory = self._factories.get(factory_class)
+        if factory is None:
+            factory = factory_class(self.metadata_extractor_factory)
+            self._factories[factory_class] = factory
+
+        return factory
+
+    def get_item_factory_for_path(self, data_path: str) -> AbstractItem:
+        """
+        Get the appropriate item factory for a data file, based on its file extension.
+        
+        Args:
+            data_path (str): Path to the data file
+            
+        Returns:
+            AbstractItem: An instance of the appropriate item factory
+            
+        Raises:
+            ValueError: If the file extension is not supported
+        """
+        # splitext only looks at the last path component
+        data_type = os.path.splitext(data_path)[1]
+        if not data_type.islower():
+            data_type = data_type.lower()
+
+        factory_class = self._factory_mapping.get(data_type)
+        factory = self._factories.get(factory_class)
+        if factory is None:
+            return self.get_item_factory(data_type)
+
+        return factory
 
     @classmethod
     def get_supported_types(cls) -> List[str]:
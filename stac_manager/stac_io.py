@@ -0,0 +1,93 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Set
+
+from pystac.stac_io import DefaultStacIO
+
+class PrefetchingStacIO(DefaultStacIO):
+    """
+    DefaultStacIO that can fetch a batch of hrefs concurrently ahead of time.
+    Prefetched documents are served from memory the first time pystac reads them.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetched: Dict[str, str] = {}
+
+    def prefetch(self, hrefs: List[str], max_workers: int = 16) -> None:
+        """
+        Read the given hrefs concurrently and keep their contents in memory.
+        :param hrefs: Absolute hrefs/URLs to fetch.
+        :param max_workers: Maximum number of concurrent reads.
+        """
+        if not hrefs:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            texts = executor.map(super().read_text_from_href, hrefs)
+            self._prefetched.update(zip(hrefs, texts))
+
+    def add_prefetched(self, href: str, text: str) -> None:
+        """
+        Serve an already fetched document for href the next time pystac reads it.
+        """
+        self._prefetched[href] = text
+
+    def read_text_from_href(self, href: str) -> str:
+        text = self._prefetched.pop(href, None)
+        if text is None:
+            text = super().read_text_from_href(href)
+        return text
+
+class ThreadedWriteStacIO(DefaultStacIO):
+    """
+    DefaultStacIO that hands file writes off to a thread pool.
+    Use it as a context manager, pending writes are waited on (and any error re-raised) on exit.
+    Outside of the context manager writes happen synchronously.
+    With max_pending set, a write waits for the oldest pending writes once that many are queued, 
+    so the JSON text of queued writes doesn't pile up in memory.
+    """
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Deque[Future] = deque()
+
+        # directories already created during this save, most items share a collection directory
+        self._created_dirs: Set[str] = set()
+
+    def __enter__(self) -> "ThreadedWriteStacIO":
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            for future in self._futures:
+                future.result()
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+            self._futures = deque()
+            self._created_dirs = set()
+
+    def write_text_to_href(self, href: str, txt: str) -> None:
+        # remote hrefs are left to DefaultStacIO (which raises for URLs)
+        if self._executor is None or "://" in href:
+            return super().write_text_to_href(href, txt)
+
+        # create directories here, concurrent makedirs calls on the same directory would race
+        dirname = os.path.dirname(href)
+        if dirname and dirname not in self._created_dirs:
+            os.makedirs(dirname, exist_ok=True)
+            self._created_dirs.add(dirname)
+
+        self._futures.append(self._executor.submit(self._write_file, href, txt))
+
+        while self.max_pending and len(self._futures) > self.max_pending:
+            self._futures.popleft().result()
+
+    @staticmethod
+    def _write_file(href: str, txt: str) -> None:
+        with open(href, "w", encoding="utf-8") as f:
+            f.write(txt)
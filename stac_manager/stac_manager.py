@@ -83,6 +83,7 @@ class STACManager:
         # Clear all chidren and items
         catalog.catalog.clear_items() 
         catalog.catalog.clear_children()
+        catalog.invalidate_collection_index()
 
         # resave the removed catalog to disk
         catalog.save_catalog()
@@ -189,7 +190,7 @@ class STACManager:
         catalog_manager = self.catalog_managers.get(catalog_id)
         if not catalog_manager:
             raise ValueError(f"Catalog with ID '{catalog_id}' does not exist.")
-        catalog_manager.catalog.save(catalog_manager.catalog_path)
+        catalog_manager.save_catalog()
     
     def save_all_catalogs(self, 
                           catalog_type : pystac.CatalogType = pystac.CatalogType.SELF_CONTAINED
@@ -1,29 +1,30 @@
+import io
 import os
-from pathlib import Path
-import uuid
+import copy
+import functools
 from abc import ABC, abstractmethod
 import json
+import urllib.parse
 import urllib.request
-from datetime import datetime, timezone
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Tuple, Union
-from enum import Enum
-import warnings 
-
-
-from shapely.geometry import Polygon, MultiPolygon, mapping
-import rasterio
-from rasterio.crs import CRS
-from rasterio.transform import from_bounds
-import rasterio
-import xarray as xr 
+import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING, IO, List, Optional, Dict, Any, Tuple
+from types import MappingProxyType
+
+
 import numpy as np
-import rio_stac
 
 import pystac
 from pystac import MediaType
 
-from stac_manager.constants import FILE_EXT_TO_MEDIA_TYPE
+from stac_manager.constants import FILE_EXT_TO_MEDIA_TYPE, GDAL_CONFIG_OPTIONS
+
+# The file format libraries are imported by the extractors that use them, so importing 
+# the package doesn't pay for all of them: xarray (and pandas) for NetCDF, 
+# rasterio/rio_stac for TIF/VRT and shapely for STAC catalog JSON
+if TYPE_CHECKING:
+    import rasterio
+    import xarray as xr
+    from shapely.geometry import Polygon
 
 class Metadata:
     """
@@ -31,6 +32,8 @@ class Metadata:
     Attributes are stored as key-value pairs in a dictionary.
     """
 
+    __slots__ = ('metadata',)
+
     def __init__(self, **kwargs):
         """
         Initialize Metadata with dynamic attributes.
@@ -53,12 +56,30 @@ class Metadata:
     def __repr__(self):
         return f"Metadata({self.metadata})"
 
+@functools.lru_cache(maxsize=64)
+def _ext_to_media_type(ext: str) -> Optional[MediaType]:
+    """Look up the MediaType for a file extension (without the dot), in any case"""
+    return FILE_EXT_TO_MEDIA_TYPE.get(f".{ext.lower()}")
+
+@functools.lru_cache(maxsize=1)
+def _proj_ext_path() -> str:
+    """The projection extension schema URL for the version rio_stac writes, built once"""
+    import rio_stac
+
+    return f"https://stac-extensions.github.io/projection/{rio_stac.stac.PROJECTION_EXT_VERSION}/schema.json"
+
 # Abstract Base Class for Metadata Extractors
 class MetaDataExtractor(ABC):
     """
     Abstract base class for metadata extraction.
     """
 
+    __slots__ = ('file_path',)
+
+    # whether results can be cached on the file's own modification time and size, 
+    # see MetaDataExtractorFactory.extract_metadata()
+    cacheable = True
+
     def __init__(self, file_path: str):
         self.file_path = file_path
 
@@ -69,6 +90,13 @@ class MetaDataExtractor(ABC):
         """
         pass
 
+    def extract_bbox(self) -> List[float]:
+        """
+        Extract only the [xmin, ymin, xmax, ymax] bbox of the file. 
+        Runs a full extract_metadata(), extractors that can read the bbox on its own override this.
+        """
+        return self.extract_metadata().get('bbox')
+
     @classmethod
     def get_media_type(cls, file_path: str) -> MediaType:
         """
@@ -81,15 +109,61 @@ class MetaDataExtractor(ABC):
             MediaType: The inferred MediaType enum value, or None if not matched.
         """
         # Get the file extension
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
+        _, dot, ext = file_path.rpartition('.')
+        if not dot:
+            return None
 
         # Return the corresponding MediaType enum or None if not found
-        return FILE_EXT_TO_MEDIA_TYPE.get(ext)
+        return _ext_to_media_type(ext)
     
+    @classmethod
+    def _bounds_to_geometry(cls, left: float, bottom: float, right: float, top: float) -> Dict[str, Any]:
+        """
+        Build a GeoJSON Polygon for a bounding box, the same output as shapely's 
+        mapping(Polygon(...)) without creating a GEOS geometry.
+        """
+        return {
+            "type": "Polygon",
+            "coordinates": [[
+                [left, bottom],
+                [left, top],
+                [right, top],
+                [right, bottom],
+                [left, bottom]
+            ]]
+        }
+
+    @classmethod
+    def _read_raster_metadata(cls, src: 'rasterio.DatasetReader') -> Tuple[List[float], Dict[str, Any], Dict[str, Any]]:
+        """
+        Read the bbox, footprint and projection extension properties of an open rasterio dataset. 
+        The projection properties come from rio_stac's get_projection_info() on the same dataset, 
+        so the file is only opened once.
+
+        Returns: (bbox, footprint, proj_ext_props)
+        """
+        # BoundingBox is a namedtuple of (left, bottom, right, top)
+        left, bottom, right, top = src.bounds
+        bbox = [left, bottom, right, top]
+        footprint = cls._bounds_to_geometry(left, bottom, right, top)
+
+        return bbox, footprint, cls.get_proj_ext_properties(src)
+
+    @classmethod
+    def _read_raster_bbox(cls, file_path: str) -> List[float]:
+        """
+        Open a raster and read only its bounds, no footprint, projection info or VRT sources.
+        """
+        import rasterio
+
+        with rasterio.Env(**GDAL_CONFIG_OPTIONS), rasterio.open(file_path) as src:
+            return list(src.bounds)
+
     @classmethod
     def get_proj_ext_properties(self, src) -> dict:
         """Update the properties dictionary with the metadata from the dataset."""
+        import rio_stac
+
         try:
             proj_ext_props = {
                 f"proj:{name}": value
@@ -107,7 +181,7 @@ class MetaDataExtractor(ABC):
     @classmethod
     def get_proj_ext_path(self) -> str:
         """Return the path to the projection extension schema."""
-        return f"https://stac-extensions.github.io/projection/{rio_stac.stac.PROJECTION_EXT_VERSION}/schema.json"
+        return _proj_ext_path()
 
 # Concrete Class for TIF Files
 class TIFMetaData(MetaDataExtractor):
@@ -115,6 +189,8 @@ class TIFMetaData(MetaDataExtractor):
     Metadata extraction for TIF files using rasterio.
     """
 
+    __slots__ = ()
+
     def extract_metadata(self):
         """
         Extract metadata from a VRT file.
@@ -123,15 +199,16 @@ class TIFMetaData(MetaDataExtractor):
         properties = {} 
         stac_extensions = []
 
+        import rasterio
+
         # Assuming you have a way to open and read VRT metadata, e.g., using rasterio
-        with rasterio.open(self.file_path) as src:
+        with rasterio.Env(**GDAL_CONFIG_OPTIONS), rasterio.open(self.file_path) as src:
             
-            bbox = self.get_bbox(src)
-            footprint = self.get_footprint(src)
+            # bbox, footprint and projection extension properties in one pass over the dataset
+            bbox, footprint, proj_ext_props = self._read_raster_metadata(src)
             media_type = self.get_media_type(self.file_path)
 
             # Add projection extension properties            
-            proj_ext_props = self.get_proj_ext_properties(src)
             properties.update(proj_ext_props)
 
             # add the projection extension schema path
@@ -147,24 +224,21 @@ class TIFMetaData(MetaDataExtractor):
                                 )
             return metadata
 
-    def get_bbox(self, src : rasterio.DatasetReader) -> List[float]:
-        bbox = [src.bounds.left, src.bounds.bottom, src.bounds.right, src.bounds.top]
+    def extract_bbox(self) -> List[float]:
+        return self._read_raster_bbox(self.file_path)
+
+    def get_bbox(self, src : 'rasterio.DatasetReader') -> List[float]:
+        bounds = src.bounds
+        bbox = [bounds.left, bounds.bottom, bounds.right, bounds.top]
         return bbox 
         
-    def get_footprint(self, src : rasterio.DatasetReader) -> Dict[str, Any]:
+    def get_footprint(self, src : 'rasterio.DatasetReader') -> Dict[str, Any]:
         """
         Helper method to compute the footprint of the VRT file.
         """
         
         bounds = src.bounds
-        footprint = Polygon([
-            [bounds.left, bounds.bottom],
-            [bounds.left, bounds.top],
-            [bounds.right, bounds.top],
-            [bounds.right, bounds.bottom]
-        ])
-
-        return mapping(footprint)
+        return self._bounds_to_geometry(bounds.left, bounds.bottom, bounds.right, bounds.top)
 
 # Concrete Class for VRT Files
 class VRTMetaData(MetaDataExtractor):
@@ -172,6 +246,8 @@ class VRTMetaData(MetaDataExtractor):
     Metadata extraction for TIF files using rasterio.
     """
 
+    __slots__ = ()
+
     def extract_metadata(self):
         """
         Extract metadata from a VRT file.
@@ -180,16 +256,17 @@ class VRTMetaData(MetaDataExtractor):
         properties = {} 
         stac_extensions = []
 
+        import rasterio
+
         # Assuming you have a way to open and read VRT metadata, e.g., using rasterio
-        with rasterio.open(self.file_path) as src:
+        with rasterio.Env(**GDAL_CONFIG_OPTIONS), rasterio.open(self.file_path) as src:
             
-            bbox = self.get_bbox(src)
-            footprint = self.get_footprint(src)
+            # bbox, footprint and projection extension properties in one pass over the dataset
+            bbox, footprint, proj_ext_props = self._read_raster_metadata(src)
             vrt_files = self.get_vrt_files(src)
             media_type = self.get_media_type(self.file_path)
 
             # Add projection extension properties
-            proj_ext_props = self.get_proj_ext_properties(src)
             properties.update(proj_ext_props)
 
             # add the projection extension schema path
@@ -205,31 +282,75 @@ class VRTMetaData(MetaDataExtractor):
                                 stac_extensions=stac_extensions)
             return metadata
 
-    def get_bbox(self, src : rasterio.DatasetReader) -> List[float]:
-        bbox = [src.bounds.left, src.bounds.bottom, src.bounds.right, src.bounds.top]
+    def extract_bbox(self) -> List[float]:
+        return self._read_raster_bbox(self.file_path)
+
+    def get_bbox(self, src : 'rasterio.DatasetReader') -> List[float]:
+        bounds = src.bounds
+        bbox = [bounds.left, bounds.bottom, bounds.right, bounds.top]
         return bbox 
         
-    def get_footprint(self, src : rasterio.DatasetReader) -> Dict[str, Any]:
+    def get_footprint(self, src : 'rasterio.DatasetReader') -> Dict[str, Any]:
         """
         Helper method to compute the footprint of the VRT file.
         """
         
         bounds = src.bounds
-        footprint = Polygon([
-            [bounds.left, bounds.bottom],
-            [bounds.left, bounds.top],
-            [bounds.right, bounds.top],
-            [bounds.right, bounds.bottom]
-        ])
-
-        return mapping(footprint)
+        return self._bounds_to_geometry(bounds.left, bounds.bottom, bounds.right, bounds.top)
 
     def get_vrt_files(self, src) -> list[str]:
         """
-        Assuming we extract a list of VRT files involved.
-        This would be a method to return the VRT-specific files.
+        List the source files referenced by the VRT.
+        The sources are parsed from the VRT XML GDAL already read when opening the file, so the 
+        VRT isn't read a second time and GDAL doesn't have to check every source file 
+        (a request per source for remote mosaics). src.files is used if the XML can't be read.
+        """
+        try:
+            vrt_xml = src.tags(ns="xml:VRT").get("xml:VRT")
+            if not vrt_xml:
+                return self._read_vrt_source_files(self.file_path)
+            return self._parse_vrt_source_files(io.BytesIO(vrt_xml.encode("utf-8")), self.file_path)
+        except Exception:
+            return src.files if src.files else []
+
+    @classmethod
+    def _read_vrt_source_files(cls, vrt_path: str) -> List[str]:
+        """
+        Read a local or http(s) VRT file and list its source files, see _parse_vrt_source_files().
         """
-        return src.files if src.files else []
+        if vrt_path.startswith(("http://", "https://")):
+            open_vrt = lambda: urllib.request.urlopen(vrt_path, timeout=30)
+        else:
+            open_vrt = lambda: open(vrt_path, "rb")
+
+        with open_vrt() as f:
+            return cls._parse_vrt_source_files(f, vrt_path)
+
+    @staticmethod
+    def _parse_vrt_source_files(vrt_file: IO[bytes], vrt_path: str) -> List[str]:
+        """
+        Parse the <SourceFilename> elements of VRT XML. 
+        Paths marked relativeToVRT="1" are resolved against the VRT's location (vrt_path), 
+        sources used by several bands are listed once.
+        """
+        if vrt_path.startswith(("http://", "https://")):
+            resolve = lambda name: urllib.parse.urljoin(vrt_path, name)
+        else:
+            resolve = lambda name: os.path.join(os.path.dirname(vrt_path), name)
+
+        source_files = {}
+        # stream the XML, national mosaics list thousands of sources
+        for _, element in ET.iterparse(vrt_file, events=("end",)):
+            if element.tag == "SourceFilename":
+                name = (element.text or "").strip()
+                if name:
+                    if element.get("relativeToVRT") == "1":
+                        name = resolve(name)
+                    source_files[name] = None
+            # children have been handled by the time their parent ends
+            element.clear()
+
+        return list(source_files)
 
     
 
@@ -293,6 +414,11 @@ class CatalogJsonMetaData(MetaDataExtractor):
     Metadata extraction for STAC Catalog JSON files
     """
 
+    __slots__ = ()
+
+    # the metadata depends on the catalog's item files too, and the items are not safe to share
+    cacheable = False
+
     def extract_metadata(self):
         """
         Extract metadata from a VRT file.
@@ -333,6 +459,8 @@ class CatalogJsonMetaData(MetaDataExtractor):
         return coords
     
     def _get_polygon(self, items):
+        from shapely.geometry import Polygon
+
         coords = self._get_coords(items)
 
         points = []
@@ -346,14 +474,15 @@ class CatalogJsonMetaData(MetaDataExtractor):
         return polygon 
     
 
-    def get_bbox(self,  polygon : Polygon) -> List[float]:
+    def get_bbox(self,  polygon : 'Polygon') -> List[float]:
         bbox = list(polygon.bounds)
         return bbox 
         
-    def get_footprint(self,  polygon : Polygon) -> Dict[str, Any]:
+    def get_footprint(self,  polygon : 'Polygon') -> Dict[str, Any]:
         """
         Helper method to compute the footprint of the VRT file.
         """
+        from shapely.geometry import mapping
         
         footprint = mapping(polygon)
 
@@ -365,6 +494,8 @@ class NetCDFMetaData(MetaDataExtractor):
     Metadata extraction for TIF files using rasterio.
     """
 
+    __slots__ = ()
+
     def extract_metadata(self):
         """
         Extract metadata from a VRT file.
@@ -373,6 +504,8 @@ class NetCDFMetaData(MetaDataExtractor):
         properties = {} 
         stac_extensions = []
 
+        import xarray as xr
+
         # Open the NetCDF file remotely
         with xr.open_dataset(self.file_path) as src:
             
@@ -401,7 +534,7 @@ class NetCDFMetaData(MetaDataExtractor):
                                 )
             return metadata
 
-    def get_bbox(self, src: xr.Dataset) -> List[float]:
+    def get_bbox(self, src: 'xr.Dataset') -> List[float]:
             """
             Attempt to retrieve latitude and longitude variables from a NetCDF file 
             by trying several common variable names.
@@ -438,17 +571,9 @@ class NetCDFMetaData(MetaDataExtractor):
         """
         
         left, bottom, right, top = bbox
-        
-        footprint = Polygon([
-            [left, bottom],
-            [left, top],
-            [right, top],
-            [right, bottom]
-        ])
-
-        return mapping(footprint)
+        return self._bounds_to_geometry(left, bottom, right, top)
 
-    def get_netcdf_attrs(self, src: xr.Dataset) -> dict:
+    def get_netcdf_attrs(self, src: 'xr.Dataset') -> dict:
         try:
             attrs = src.attrs
             serializable_attrs = {}
@@ -483,20 +608,62 @@ class MetaDataExtractorFactory:
     """
     Factory to create appropriate metadata extractors based on file type.
     """
-    # Add a mapping to associate file extensions with metadata extractors
-    _extractor_mapping = {
+    # Add a mapping to associate file extensions with metadata extractors (read-only)
+    _extractor_mapping = MappingProxyType({
         ".tif": TIFMetaData,
         ".tiff" : TIFMetaData,
         ".vrt": VRTMetaData,
         ".nc" : NetCDFMetaData,
         ".json" : CatalogJsonMetaData
-    }
+    })
 
     @staticmethod
-    def get_metadata_extractor(file_path: str) -> MetaDataExtractor:
-        file_extension = os.path.splitext(file_path)[-1].lower()
+    def get_extractor_class(file_path: str) -> type:
+        """Get the MetaDataExtractor subclass for a file, based on its extension"""
+        file_extension = os.path.splitext(file_path)[-1]
+        if not file_extension.islower():
+            file_extension = file_extension.lower()
         extractor_class = MetaDataExtractorFactory._extractor_mapping.get(file_extension)
 
         if not extractor_class:
             raise ValueError(f"Unsupported file type: {file_extension}")
-        return extractor_class(file_path)
+        return extractor_class
+
+    @staticmethod
+    def get_metadata_extractor(file_path: str) -> MetaDataExtractor:
+        return MetaDataExtractorFactory.get_extractor_class(file_path)(file_path)
+
+    @classmethod
+    def extract_metadata(cls, file_path: str) -> Metadata:
+        """
+        Extract metadata from a file with the matching extractor.
+        Results for local files are cached on (path, modification time, size), so a file 
+        is only opened again once it changes, and no extractor is created on a cache hit. 
+        Remote files are extracted on every call.
+        Every call returns its own copy, so items built from the same file don't share 
+        their bbox, geometry or properties with each other or with the cache.
+        """
+        extractor_class = cls.get_extractor_class(file_path)
+        if not extractor_class.cacheable:
+            return extractor_class(file_path).extract_metadata()
+
+        try:
+            stat = os.stat(file_path)
+        except (OSError, ValueError):
+            # remote hrefs have no cheap fingerprint, missing files raise from the extractor
+            return extractor_class(file_path).extract_metadata()
+
+        cached = _extract_local_metadata(extractor_class, file_path, stat.st_mtime_ns, stat.st_size)
+        return Metadata(**copy.deepcopy(cached.metadata))
+
+    @classmethod
+    def extract_bbox(cls, file_path: str) -> List[float]:
+        """
+        Extract only the bbox of a file with the matching extractor. Cheaper than extract_metadata() 
+        for rasters, which skip the footprint, projection properties and VRT source listing.
+        """
+        return cls.get_extractor_class(file_path)(file_path).extract_bbox()
+
+@functools.lru_cache(maxsize=1024)
+def _extract_local_metadata(extractor_class: type, file_path: str, mtime_ns: int, size: int) -> Metadata:
+    return extractor_class(file_path).extract_metadata()
@@ -0,0 +1,22 @@
+import pytest
+import rasterio
+import numpy as np
+
+@pytest.fixture
+def create_test_tifs(tmp_path):
+    """Create two GeoTIFFs with different bounds for testing, removed with tmp_path after the test"""
+    paths = []
+    for i, bounds in enumerate([(-10, -10, 0, 0), (0, 0, 10, 10)]):
+        path = str(tmp_path / f"test_{i}.tif")
+        with rasterio.open(
+            path, 'w',
+            driver='GTiff',
+            height=10, width=10,
+            count=1,
+            dtype=np.uint8,
+            crs='+proj=latlong',
+            transform=rasterio.transform.from_bounds(*bounds, 10, 10)
+        ) as dst:
+            dst.write(np.ones((1, 10, 10), dtype=np.uint8) * 255)
+        paths.append(path)
+    yield paths
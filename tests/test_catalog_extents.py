@@ -0,0 +1,48 @@
+import pytest
+import numpy as np
+import pystac
+from datetime import datetime, timezone
+from pystac import Extent
+from stac_manager.catalog_extents import ExtentBuilder
+
+class TestExtentBuilder:
+    def test_update_bboxes(self):
+        """Test the bbox is the union of all bboxes added"""
+        builder = ExtentBuilder()
+        builder.update_bboxes(np.array([[0, 0, 1, 1], [-1, 0.5, 0.5, 2]]))
+        builder.update_bbox([0, -3, 0.5, 0.5])
+        assert builder.bbox == [-1.0, -3.0, 1.0, 2.0]
+
+    def test_update_bboxes_empty(self):
+        """Test an empty batch of bboxes leaves the bbox unset"""
+        builder = ExtentBuilder()
+        builder.update_bboxes(np.empty((0, 4)))
+        assert builder.bbox is None
+
+    def test_from_files(self, create_test_tifs):
+        """Test building an extent covering the bounds of multiple files"""
+        extent = ExtentBuilder.from_files(create_test_tifs).build()
+        assert isinstance(extent, Extent)
+        assert extent.spatial.bboxes[0] == [-10.0, -10.0, 10.0, 10.0]
+
+def test_default_extent_is_shared_and_not_mutated():
+    """Test that collections without an extent share one default Extent that item updates replace rather than mutate"""
+    from stac_manager.catalog_extents import default_extent
+    from stac_manager.collection_manager import CollectionManager
+
+    first = CollectionManager('first', 'First', 'First collection')
+    second = CollectionManager('second', 'Second', 'Second collection')
+    assert first.collection.extent is default_extent()
+    assert second.collection.extent is default_extent()
+
+    first.collection.add_item(pystac.Item(
+        id='test-item',
+        geometry=None,
+        bbox=[0, 0, 1, 1],
+        datetime=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        properties={}
+    ))
+    first.update_extent_from_items()
+
+    assert first.collection.extent is not default_extent()
+    assert default_extent().spatial.bboxes == [[-180.0, -90.0, 180.0, 90.0]]
@@ -0,0 +1,128 @@
+import os
+import pytest
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import pystac
+from stac_manager.catalog_loader import (
+    CatalogLoaderFactory, 
+    LocalCatalogDataLoader, 
+    RemoteCatalogDataLoader,
+    _read_remote_catalog_text
+)
+from stac_manager.stac_io import PrefetchingStacIO
+from stac_manager.catalog_extents import default_extent
+
+class TestCatalogLoaderFactory:
+    def test_local_path_loader(self):
+        """Test paths without a scheme get a LocalCatalogDataLoader"""
+        loader = CatalogLoaderFactory.create_loader('/data/stac/catalog.json')
+        assert isinstance(loader, LocalCatalogDataLoader)
+        assert loader.catalog_path == '/data/stac/catalog.json'
+
+    def test_file_scheme_loader(self):
+        """Test file:// paths get a LocalCatalogDataLoader"""
+        loader = CatalogLoaderFactory.create_loader('file:///data/stac/catalog.json')
+        assert isinstance(loader, LocalCatalogDataLoader)
+
+    @pytest.mark.parametrize('url', [
+        'http://example.com/catalog.json',
+        'https://example.com/catalog.json',
+        'HTTPS://example.com/catalog.json'
+    ])
+    def test_remote_loader(self, url):
+        """Test http(s) URLs get a RemoteCatalogDataLoader"""
+        loader = CatalogLoaderFactory.create_loader(url)
+        assert isinstance(loader, RemoteCatalogDataLoader)
+
+    def test_unknown_scheme_falls_back_to_local(self):
+        """Test schemes without a registered loader fall back to a LocalCatalogDataLoader"""
+        loader = CatalogLoaderFactory.create_loader('httpx://example.com/catalog.json')
+        assert isinstance(loader, LocalCatalogDataLoader)
+
+class TestPrefetchingStacIO:
+    @pytest.fixture
+    def saved_catalog_path(self):
+        """Save a catalog with two child collections to a temporary directory"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            catalog = pystac.Catalog(id='test-catalog', description='A catalog for testing')
+            for collection_id in ['collection-1', 'collection-2']:
+                catalog.add_child(pystac.Collection(
+                    id=collection_id,
+                    description=f'{collection_id} description',
+                    extent=default_extent()
+                ))
+            catalog.normalize_hrefs(tmpdir)
+            catalog.save(catalog_type=pystac.CatalogType.SELF_CONTAINED)
+            yield os.path.join(tmpdir, 'catalog.json')
+
+    def test_children_served_from_prefetch(self, saved_catalog_path):
+        """Test prefetched child documents are used when pystac resolves the child links"""
+        stac_io = PrefetchingStacIO()
+        catalog = pystac.Catalog.from_file(saved_catalog_path, stac_io=stac_io)
+        stac_io.prefetch([link.get_absolute_href() for link in catalog.get_child_links()])
+        assert len(stac_io._prefetched) == 2
+
+        children = list(catalog.get_children())
+        assert [child.id for child in children] == ['collection-1', 'collection-2']
+        assert stac_io._prefetched == {}
+
+class TestLocalCatalogDataLoader:
+    def test_exists(self):
+        """Test exists() reports whether the catalog file is present"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            catalog_path = os.path.join(tmpdir, 'catalog.json')
+            assert not LocalCatalogDataLoader(catalog_path).exists()
+            assert not LocalCatalogDataLoader(tmpdir).exists()
+
+            with open(catalog_path, 'w') as f:
+                f.write('{}')
+            assert LocalCatalogDataLoader(catalog_path).exists()
+
+class TestRemoteCatalogDataLoader:
+    @pytest.fixture
+    def served_catalog(self):
+        """Serve a saved catalog over HTTP with an ETag, counting the GET requests per path"""
+        gets = []
+
+        class Handler(SimpleHTTPRequestHandler):
+            def do_GET(self):
+                gets.append(self.path)
+                super().do_GET()
+
+            def end_headers(self):
+                self.send_header("ETag", '"v1"')
+                super().end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            catalog = pystac.Catalog(id='test-catalog', description='A catalog for testing')
+            catalog.normalize_hrefs(tmpdir)
+            catalog.save(catalog_type=pystac.CatalogType.SELF_CONTAINED)
+
+            server = ThreadingHTTPServer(('127.0.0.1', 0), partial(Handler, directory=tmpdir))
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                yield f'http://127.0.0.1:{server.server_port}/catalog.json', gets
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def test_unchanged_catalog_downloaded_once(self, served_catalog):
+        """Test a catalog with an unchanged ETag is not downloaded again, and each load gets its own Catalog"""
+        url, gets = served_catalog
+        _read_remote_catalog_text.cache_clear()
+
+        catalogs = []
+        for _ in range(2):
+            loader = RemoteCatalogDataLoader(url)
+            assert loader.exists()
+            catalogs.append(loader.load_catalog())
+
+        assert gets.count('/catalog.json') == 1
+        assert [catalog.id for catalog in catalogs] == ['test-catalog', 'test-catalog']
+        assert catalogs[0] is not catalogs[1]
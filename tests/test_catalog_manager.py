@@ -5,6 +5,7 @@ import pystac
 import rasterio
 import numpy as np
 from pathlib import Path
+from datetime import datetime, timezone
 
 from stac_manager.catalog_manager import CatalogManager
 from stac_manager.stac_metadata import MetaDataExtractorFactory
@@ -137,4 +138,345 @@ class TestCatalogManager:
 
         # Verify properties were updated
         item = catalog_manager.get_item_by_id('test-collection', Path(create_test_tif).stem)
-        assert item.properties.get('custom_property') == 'test_value'
\ No newline at end of file
+        assert item.properties.get('custom_property') == 'test_value'
+
+    def test_collections_indexed_on_load(self, catalog_manager, temp_catalog_path):
+        """Test collections of a saved catalog can be looked up after reloading it"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.save_catalog()
+
+        reloaded = CatalogManager(catalog_path=os.path.join(temp_catalog_path, 'catalog.json'))
+        collection = reloaded.get_collection_by_id('test-collection')
+        assert collection is not None
+        assert collection.title == 'Test Collection'
+        assert reloaded.get_collection_by_id('missing-collection') is None
+
+    def test_collection_index_follows_catalog_changes(self, catalog_manager):
+        """Test collections removed on the pystac catalog directly are no longer found"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        assert catalog_manager.get_collection_by_id('test-collection') is not None
+
+        catalog_manager.get_catalog().clear_children()
+        assert catalog_manager.get_collection_by_id('test-collection') is None
+
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.catalog.clear_children()
+        catalog_manager.invalidate_collection_index()
+        assert catalog_manager.get_collection_by_id('test-collection') is None
+
+    def test_missing_child_does_not_fail_load(self, catalog_manager, temp_catalog_path):
+        """Test a catalog whose collection file was deleted still loads, the error surfaces on lookup"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.save_catalog()
+        os.remove(os.path.join(temp_catalog_path, 'test-collection', 'collection.json'))
+
+        reloaded = CatalogManager(catalog_path=os.path.join(temp_catalog_path, 'catalog.json'))
+        assert reloaded.get_catalog() is not None
+        with pytest.raises(FileNotFoundError):
+            reloaded.get_collection_by_id('test-collection')
+
+
+    def test_add_items_to_collection(self, catalog_manager, create_test_tifs):
+        """Test adding a batch of items updates the collection extent once for all items"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+
+        catalog_manager.add_items_to_collection(
+            collection_id='test-collection', 
+            data_paths=create_test_tifs
+        )
+
+        collection = catalog_manager.get_collection_by_id('test-collection')
+        assert len(list(collection.get_items())) == 2
+        assert collection.extent.spatial.bboxes[0] == [-10.0, -10.0, 10.0, 10.0]
+
+    @pytest.mark.parametrize('add_items', ['add_items_to_collection', 'add_items_parallel'])
+    def test_add_items_failure_leaves_collection_unchanged(self, catalog_manager, create_test_tifs, temp_catalog_path, add_items):
+        """Test a batch with an item that cannot be created attaches none of its items"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection',
+            title='Test Collection',
+            description='A collection for testing'
+        )
+        catalog_manager.add_item_to_collection('test-collection', create_test_tifs[0])
+
+        missing = os.path.join(temp_catalog_path, 'missing.tif')
+        with pytest.raises(ValueError, match='missing.tif'):
+            getattr(catalog_manager, add_items)('test-collection', [create_test_tifs[1], missing])
+
+        collection = catalog_manager.get_collection_by_id('test-collection')
+        assert [item.id for item in collection.get_items()] == [Path(create_test_tifs[0]).stem]
+        assert collection.extent.spatial.bboxes[0] == [-10.0, -10.0, 0.0, 0.0]
+
+    def test_add_item_defer_extent_update(self, catalog_manager, create_test_tifs):
+        """Test the collection extent is left untouched when the update is deferred"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+
+        catalog_manager.add_item_to_collection(
+            collection_id='test-collection', 
+            data_path=create_test_tifs[0],
+            defer_extent_update=True
+        )
+
+        collection = catalog_manager.get_collection_by_id('test-collection')
+        assert collection.extent.spatial.bboxes[0] == [-180.0, -90.0, 180.0, 90.0]
+
+    def test_add_items_parallel(self, catalog_manager, create_test_tifs):
+        """Test adding a batch of items with a thread pool keeps the input order"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+
+        catalog_manager.add_items_parallel(
+            collection_id='test-collection', 
+            data_paths=create_test_tifs,
+            max_workers=2
+        )
+
+        collection = catalog_manager.get_collection_by_id('test-collection')
+        items = list(collection.get_items())
+        assert [item.id for item in items] == [Path(p).stem for p in create_test_tifs]
+        assert collection.extent.spatial.bboxes[0] == [-10.0, -10.0, 10.0, 10.0]
+
+    def test_save_catalog_writes_items(self, catalog_manager, temp_catalog_path, create_test_tifs):
+        """Test saving a catalog writes every item so it can be reloaded"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.add_items_to_collection(
+            collection_id='test-collection', 
+            data_paths=create_test_tifs
+        )
+        catalog_manager.save_catalog()
+
+        reloaded = CatalogManager(catalog_path=os.path.join(temp_catalog_path, 'catalog.json'))
+        items = reloaded.list_collection_items('test-collection')
+        assert sorted(item.id for item in items) == sorted(Path(p).stem for p in create_test_tifs)
+
+    def test_save_index_then_save_full(self, catalog_manager, temp_catalog_path, create_test_tifs):
+        """Test save_index writes only catalog/collection JSON and save_full writes the items"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.add_items_to_collection(
+            collection_id='test-collection', 
+            data_paths=create_test_tifs
+        )
+        catalog_manager.save_index()
+
+        collection_dir = os.path.join(temp_catalog_path, 'test-collection')
+        assert os.path.isfile(os.path.join(temp_catalog_path, 'catalog.json'))
+        assert os.listdir(collection_dir) == ['collection.json']
+
+        catalog_manager.save_full().join()
+
+        # an index save of a loaded catalog doesn't read its items
+        reloaded = CatalogManager(catalog_path=os.path.join(temp_catalog_path, 'catalog.json'))
+        reloaded.save_index()
+        item_links = reloaded.get_collection_by_id('test-collection').get_links(pystac.RelType.ITEM)
+        assert not any(link.is_resolved() for link in item_links)
+
+        items = reloaded.list_collection_items('test-collection')
+        assert len(items) == 2
+
+    def test_save_changes_writes_only_new_items(self, catalog_manager, temp_catalog_path, create_test_tifs):
+        """Test save_changes writes new items without rewriting the items already saved"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.add_item_to_collection('test-collection', create_test_tifs[0])
+        catalog_manager.save_catalog()
+
+        first_id, second_id = (Path(p).stem for p in create_test_tifs)
+        first_item_path = os.path.join(temp_catalog_path, 'test-collection', first_id, f'{first_id}.json')
+        first_item_mtime = os.stat(first_item_path).st_mtime_ns
+
+        reloaded = CatalogManager(catalog_path=os.path.join(temp_catalog_path, 'catalog.json'))
+        reloaded.add_item_to_collection('test-collection', create_test_tifs[1], defer_extent_update=True)
+        reloaded.save_changes()
+
+        assert os.stat(first_item_path).st_mtime_ns == first_item_mtime
+
+        saved = CatalogManager(catalog_path=os.path.join(temp_catalog_path, 'catalog.json'))
+        collection = saved.get_collection_by_id('test-collection')
+        assert sorted(item.id for item in collection.get_items()) == sorted([first_id, second_id])
+        assert collection.extent.spatial.bboxes[0] == [-10.0, -10.0, 10.0, 10.0]
+
+    def test_stream_items_to_collection(self, catalog_manager, temp_catalog_path, create_test_tifs):
+        """Test streamed items are written to disk and only linked from the collection"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection',
+            title='Test Collection',
+            description='A collection for testing'
+        )
+        # a sibling collection of a catalog that was never saved is written too
+        catalog_manager.add_child_collection(
+            collection_id='other-collection',
+            title='Other Collection',
+            description='Another collection for testing'
+        )
+        catalog_manager.stream_items_to_collection('test-collection', create_test_tifs, max_workers=1)
+
+        collection = catalog_manager.get_collection_by_id('test-collection')
+        item_links = collection.get_links(pystac.RelType.ITEM)
+        assert len(item_links) == 2
+        assert not any(link.is_resolved() for link in item_links)
+        assert collection.extent.spatial.bboxes[0] == [-10.0, -10.0, 10.0, 10.0]
+
+        first_id, second_id = (Path(p).stem for p in create_test_tifs)
+        saved = CatalogManager(catalog_path=os.path.join(temp_catalog_path, 'catalog.json'))
+        saved_collection = saved.get_collection_by_id('test-collection')
+        assert sorted(item.id for item in saved_collection.get_items()) == sorted([first_id, second_id])
+        assert saved_collection.extent.spatial.bboxes[0] == [-10.0, -10.0, 10.0, 10.0]
+        assert saved.get_collection_by_id('other-collection') is not None
+
+    def test_remove_items_from_collection(self, catalog_manager, create_test_tifs):
+        """Test removing a batch of items updates the extent, and a missing item leaves the collection unchanged"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.add_items_to_collection(
+            collection_id='test-collection', 
+            data_paths=create_test_tifs
+        )
+        first_id, second_id = (Path(p).stem for p in create_test_tifs)
+
+        with pytest.raises(ValueError):
+            catalog_manager.remove_items_from_collection('test-collection', [first_id, 'missing-item'])
+        assert len(catalog_manager.list_collection_items('test-collection')) == 2
+
+        catalog_manager.remove_items_from_collection('test-collection', [first_id])
+        collection = catalog_manager.get_collection_by_id('test-collection')
+        assert [item.id for item in collection.get_items()] == [second_id]
+        assert collection.extent.spatial.bboxes[0] == [0.0, 0.0, 10.0, 10.0]
+
+    def test_invalid_catalog_file_creates_root_catalog(self, temp_catalog_path):
+        """Test a catalog file that cannot be parsed is replaced by a new root catalog"""
+        catalog_path = os.path.join(temp_catalog_path, 'catalog.json')
+        with open(catalog_path, 'w') as f:
+            f.write('not json')
+
+        catalog_manager = CatalogManager(catalog_path=catalog_path)
+        assert catalog_manager.get_catalog().id == DEFAULT_ROOT_CATALOG_ID
+
+    def test_add_item_within_extent_skips_extent_update(self, catalog_manager, create_test_tif, monkeypatch):
+        """Test the collection extent is not recomputed for an item inside of the current extent"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        collection = catalog_manager.get_collection_by_id('test-collection')
+        item_datetime = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        catalog_manager.add_item_to_collection(
+            collection_id='test-collection', 
+            data_path=create_test_tif,
+            datetime=item_datetime
+        )
+        assert collection.extent.spatial.bboxes[0] == [-180.0, -90.0, 180.0, 90.0]
+        assert collection.extent.temporal.intervals[0] == [item_datetime, item_datetime]
+
+        def fail_update():
+            raise AssertionError("extent should not be recomputed")
+        monkeypatch.setattr(collection, 'update_extent_from_items', fail_update)
+
+        catalog_manager.add_item_to_collection(
+            collection_id='test-collection', 
+            data_path=create_test_tif,
+            item_id='test-item-2',
+            datetime=item_datetime
+        )
+        assert len(list(collection.get_items())) == 2
+
+    def test_add_existing_collection_is_noop(self, catalog_manager):
+        """Test that adding a collection ID twice keeps the first collection and a single child link"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Other Title', 
+            description='Another description'
+        )
+        assert len(catalog_manager.catalog.get_child_links()) == 1
+        assert catalog_manager.get_collection_by_id('test-collection').title == 'Test Collection'
+
+    def test_ingest_jobs(self, catalog_manager, create_test_tifs):
+        """Test ingesting a batch of jobs creates the collections, items and extents"""
+        from stac_manager.data_models import IngestJob
+
+        catalog_manager.ingest([
+            IngestJob('collection-1', 'Collection 1', 'First collection', create_test_tifs[:1], {"priority": 1}),
+            IngestJob('collection-2', 'Collection 2', 'Second collection', create_test_tifs),
+        ])
+
+        items_1 = catalog_manager.list_collection_items('collection-1')
+        items_2 = catalog_manager.list_collection_items('collection-2')
+        assert len(items_1) == 1
+        assert items_1[0].properties["priority"] == 1
+        assert len(items_2) == 2
+        assert "priority" not in items_2[0].properties
+        assert catalog_manager.get_collection_by_id('collection-2').extent.spatial.bboxes[0] == [-10.0, -10.0, 10.0, 10.0]
+
+    def test_ingest_job_item_ids(self, catalog_manager, create_test_tifs):
+        """Test a job's item IDs replace the IDs taken from the file names"""
+        from stac_manager.data_models import IngestJob
+
+        catalog_manager.ingest([
+            IngestJob('collection-1', 'Collection 1', 'First collection', create_test_tifs, item_ids=['first', 'second']),
+        ])
+
+        items = catalog_manager.list_collection_items('collection-1')
+        assert [item.id for item in items] == ['first', 'second']
+
+    def test_ingest_session_shares_item_datetime(self, catalog_manager, create_test_tifs):
+        """Test that items created in an ingest session share the session timestamp"""
+        catalog_manager.add_child_collection(
+            collection_id='test-collection', 
+            title='Test Collection', 
+            description='A collection for testing'
+        )
+        with catalog_manager:
+            catalog_manager.add_items_to_collection('test-collection', create_test_tifs)
+        assert catalog_manager._session_now is None
+
+        items = catalog_manager.list_collection_items('test-collection')
+        assert len(items) == 2
+        assert items[0].datetime == items[1].datetime
+        assert items[0].datetime.tzinfo is not None
@@ -35,6 +35,12 @@ class TestItemFactoryManager:
         factory = item_factory_manager.get_item_factory('.json')
         assert isinstance(factory, CatalogJsonItem)
 
+    def test_item_factory_is_reused(self, item_factory_manager):
+        """Test the same factory instance is returned for data types sharing a factory class"""
+        factory = item_factory_manager.get_item_factory('.tif')
+        assert item_factory_manager.get_item_factory('.TIF') is factory
+        assert item_factory_manager.get_item_factory('.tiff') is factory
+
     def test_unsupported_type_raises_error(self, item_factory_manager):
         """Test that an unsupported file type raises a ValueError"""
         with pytest.raises(ValueError, match="Unsupported data type"):
@@ -49,3 +55,21 @@ class TestItemFactoryManager:
         item_factory_manager.register_factory('custom', CustomItemFactory)
         factory = item_factory_manager.get_item_factory('custom')
         assert isinstance(factory, CustomItemFactory)
+
+    def test_raster_item_defaults_to_utc_datetime(self, item_factory_manager, create_test_tifs):
+        """Test an item created without a datetime gets a timezone-aware UTC datetime and leaves the caller's properties alone"""
+        from datetime import timezone
+
+        properties = {"priority": 1}
+        item = item_factory_manager.get_item_factory('.tif').create_item(create_test_tifs[0], properties=properties)
+        assert item.datetime.tzinfo == timezone.utc
+        assert item.properties["priority"] == 1
+        assert properties == {"priority": 1}
+
+    def test_get_item_factory_for_path(self, item_factory_manager):
+        """Test getting the item factory from a data path's file extension"""
+        factory = item_factory_manager.get_item_factory_for_path('/data/v1.2/dem.TIF')
+        assert isinstance(factory, RasterItem)
+        assert item_factory_manager.get_item_factory_for_path('https://host/dem.tif') is factory
+        with pytest.raises(ValueError, match="Unsupported data type"):
+            item_factory_manager.get_item_factory_for_path('/data/v1.2/dem')
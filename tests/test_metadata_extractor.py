@@ -3,12 +3,15 @@ import tempfile
 import os
 import rasterio
 import numpy as np
+from pystac import MediaType
 from stac_manager.stac_metadata import (
+    MetaDataExtractor,
     MetaDataExtractorFactory, 
     TIFMetaData, 
     VRTMetaData, 
     NetCDFMetaData,
-    Metadata
+    Metadata,
+    _extract_local_metadata
 )
 
 # ---------------------------------------------------------------------------------
@@ -81,6 +84,93 @@ class TestMetaDataExtractor:
         assert 'vrt_files' in metadata.metadata
         assert isinstance(metadata.get('vrt_files'), list)
 
+    def test_vrt_source_files_from_xml(self, create_test_vrt, create_test_tif):
+        """Test VRT source files are read from the VRT XML, resolving relative paths and listing each file once"""
+        assert VRTMetaData(create_test_vrt).extract_metadata().get('vrt_files') == [create_test_tif]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            vrt_path = os.path.join(tmpdir, 'mosaic.vrt')
+            with open(vrt_path, 'w') as f:
+                f.write('''<VRTDataset rasterXSize="10" rasterYSize="10">
+                    <VRTRasterBand dataType="Byte" band="1">
+                        <SimpleSource><SourceFilename relativeToVRT="1">tiles/a.tif</SourceFilename></SimpleSource>
+                        <ComplexSource><SourceFilename relativeToVRT="0">/data/b.tif</SourceFilename></ComplexSource>
+                    </VRTRasterBand>
+                    <VRTRasterBand dataType="Byte" band="2">
+                        <SimpleSource><SourceFilename relativeToVRT="1">tiles/a.tif</SourceFilename></SimpleSource>
+                    </VRTRasterBand>
+                </VRTDataset>''')
+
+            assert VRTMetaData._read_vrt_source_files(vrt_path) == [
+                os.path.join(tmpdir, 'tiles/a.tif'), 
+                '/data/b.tif'
+            ]
+
+    def test_vrt_source_files_from_open_dataset(self, create_test_vrt, create_test_tif, monkeypatch):
+        """Test VRT source files come from the XML GDAL already read, without reading the VRT file again"""
+        def read_again(vrt_path):
+            raise AssertionError("VRT file read a second time")
+
+        monkeypatch.setattr(VRTMetaData, '_read_vrt_source_files', staticmethod(read_again))
+        assert VRTMetaData(create_test_vrt).extract_metadata().get('vrt_files') == [create_test_tif]
+
+    def test_extract_bbox_matches_full_metadata(self, create_test_tif, create_test_vrt):
+        """Test the bbox only read gives the same bbox as the full metadata extraction"""
+        for file_path in (create_test_tif, create_test_vrt):
+            assert MetaDataExtractorFactory.extract_bbox(file_path) == \
+                MetaDataExtractorFactory.get_metadata_extractor(file_path).extract_metadata().get('bbox')
+
+    def test_get_media_type(self):
+        """Test media types are inferred from the file extension"""
+        assert MetaDataExtractor.get_media_type("/data/dem.tif") == MediaType.COG
+        assert MetaDataExtractor.get_media_type("https://host/data/DEM.TIFF") == MediaType.TIFF
+        assert MetaDataExtractor.get_media_type("/data/dem.nc") == MediaType.NETCDF
+        assert MetaDataExtractor.get_media_type("/data/dem") is None
+
+    def test_tif_footprint_geometry(self, create_test_tif):
+        """Test the TIF footprint is a closed GeoJSON Polygon of the raster bounds"""
+        metadata = TIFMetaData(create_test_tif).extract_metadata()
+        assert metadata.get('geometry') == {
+            "type": "Polygon",
+            "coordinates": [[[-180.0, -90.0], [-180.0, 90.0], [180.0, 90.0], [180.0, -90.0], [-180.0, -90.0]]]
+        }
+
+    def test_read_raster_metadata_matches_rio_stac(self, create_test_tif):
+        """Test the raster read uses rio_stac's projection properties of the open dataset"""
+        with rasterio.open(create_test_tif) as src:
+            bbox, footprint, proj_ext_props = MetaDataExtractor._read_raster_metadata(src)
+            assert proj_ext_props == MetaDataExtractor.get_proj_ext_properties(src)
+        assert bbox == [-180.0, -90.0, 180.0, 90.0]
+        assert footprint["coordinates"][0][0] == [-180.0, -90.0]
+
+    def test_extract_metadata_cached_until_file_changes(self, create_test_tif):
+        """Test metadata for a local file is reused until the file is rewritten"""
+        first = MetaDataExtractorFactory.extract_metadata(create_test_tif)
+        hits = _extract_local_metadata.cache_info().hits
+        second = MetaDataExtractorFactory.extract_metadata(create_test_tif)
+        assert _extract_local_metadata.cache_info().hits == hits + 1
+
+        # each call gets its own copy of the cached metadata
+        assert second.get('bbox') == first.get('bbox')
+        second.get('bbox')[0] = 999.0
+        assert first.get('bbox')[0] == -180.0
+        assert MetaDataExtractorFactory.extract_metadata(create_test_tif).get('bbox')[0] == -180.0
+
+        with rasterio.open(
+            create_test_tif, 'w', 
+            driver='GTiff', 
+            height=20, width=20, 
+            count=1, 
+            dtype=np.uint8, 
+            crs='+proj=latlong', 
+            transform=rasterio.transform.from_bounds(0, 0, 10, 10, 20, 20)
+        ) as dst:
+            dst.write(np.ones((1, 20, 20), dtype=np.uint8))
+
+        updated = MetaDataExtractorFactory.extract_metadata(create_test_tif)
+        assert updated is not first
+        assert updated.get('bbox') == [0.0, 0.0, 10.0, 10.0]
+
 # ---------------------------------------------------------------------------------
 # ---- Test Complex TIFs / VRTs -----
 # ---------------------------------------------------------------------------------
@@ -196,6 +286,32 @@ class TestMetaDataExtractor:
 # ---- Test NetCDFMetaData -----
 # ---------------------------------------------------------------------------------
 
+def test_netcdf_metadata_extraction():
+    """Test NetCDF metadata extraction from a small local dataset"""
+    import xarray as xr
+
+    ds = xr.Dataset(
+        {"temperature": (["lat", "lon"], np.ones((3, 3)))},
+        coords={"lat": np.linspace(-10, 10, 3), "lon": np.linspace(-20, 20, 3)}
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        nc_path = os.path.join(tmpdir, "test.nc")
+        ds.to_netcdf(nc_path)
+
+        metadata = NetCDFMetaData(nc_path).extract_metadata()
+
+    assert metadata.get("bbox") == [-20.0, -10.0, 20.0, 10.0]
+    assert metadata.get("geometry")["type"] == "Polygon"
+    assert metadata.get("media_type") == MediaType.NETCDF
+
+def test_import_does_not_load_file_format_libraries():
+    """Test that importing the package does not import xarray, rasterio or shapely until a file is read"""
+    import subprocess
+    import sys
+
+    code = "import sys, stac_manager; sys.exit(any(m in sys.modules for m in ('xarray', 'rasterio', 'shapely')))"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
         
 # NC_URL = "http://thredds.northwestknowledge.net:8080/thredds/dodsC/NWCSC_INTEGRATED_SCENARIOS_ALL_CLIMATE/bcsd-nmme/dailyForecasts/bcsd_nmme_metdata_NCAR_forecast_was_daily.nc"
 # # # NC_URL = "https://www.ngdc.noaa.gov/thredds/fileServer/crm/cudem/crm_vol9_2023.nc"